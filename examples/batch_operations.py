@@ -15,7 +15,7 @@ from permission_sdk import (
     RevokeRequest,
     SDKConfig,
 )
-from permission_sdk.utils import chunk_list
+from permission_sdk.utils import iter_chunks
 
 
 def bulk_grant_permissions_example(client: PermissionClient) -> None:
@@ -77,16 +77,16 @@ def chunked_batch_operations(client: PermissionClient) -> None:
 
     # Chunk into smaller batches (recommended: 100-200 per batch)
     chunk_size = 100
-    chunks = chunk_list(large_grant_list, chunk_size)
+    chunk_count = -(-len(large_grant_list) // chunk_size)
 
-    print(f"  Splitting into {len(chunks)} chunks of {chunk_size}\n")
+    print(f"  Splitting into {chunk_count} chunks of {chunk_size}\n")
 
-    # Process each chunk
+    # Process each chunk (built lazily, so only one is held in memory)
     total_granted = 0
-    for idx, chunk in enumerate(chunks, 1):
+    for idx, chunk in enumerate(iter_chunks(large_grant_list, chunk_size), 1):
         result = client.grant_many(chunk)
         total_granted += result.granted
-        print(f"  Chunk {idx}/{len(chunks)}: Granted {result.granted} permissions")
+        print(f"  Chunk {idx}/{chunk_count}: Granted {result.granted} permissions")
 
     print(f"\n  Total granted: {total_granted} permissions\n")
 
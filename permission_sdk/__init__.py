@@ -76,8 +76,12 @@ from permission_sdk.models import (
     Subject,
     SubjectFilter,
     UsageDetail,
+    build_all_schemas,
 )
 
+# Pay model schema construction at import time rather than on the first call
+build_all_schemas()
+
 __all__ = [
     # Version
     "__version__",
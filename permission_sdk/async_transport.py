@@ -5,12 +5,22 @@ with retry logic, error handling,
 and optional caching with invalidation support.
 """
 
+import asyncio
+import copy
+import importlib.util
 import logging
+import math
+import random
+import socket
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
 from typing import Any
 from urllib.parse import urljoin
 
 import httpx
+from httpx._utils import get_environment_proxies
 
+from permission_sdk.cache.http_cache import HTTPResponseCache
 from permission_sdk.cache.permission_cache import PermissionCacheManager
 from permission_sdk.cache.provider import create_cache_service_async
 from permission_sdk.config import SDKConfig
@@ -24,9 +34,82 @@ from permission_sdk.exceptions import (
     TimeoutError,
     ValidationError,
 )
+from permission_sdk.utils import json_dumps, json_loads, parse_retry_after
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 support in httpx requires the optional ``h2`` package
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Small check bodies should not wait on Nagle's algorithm, and keepalive
+# probes let the OS notice pooled connections that died while idle
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# Permission endpoints that get cache-aware handling, keyed by the path below
+# the API version prefix so routing is one dict lookup per request
+_PERMISSION_ROUTES = {
+    "/permissions/check": "check",
+    "/permissions/check-many": "check",
+    "/permissions/grant": "grant",
+    "/permissions/grant-many": "grant",
+    "/permissions/revoke": "revoke",
+    "/permissions/revoke-many": "revoke",
+}
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # ijson enables incremental parsing (pip install permission-sdk[stream])
+    ijson = None
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert request data into a hashable coalescing key component.
+
+    Dict items keep their insertion order: equal dicts built in a different
+    order only miss a chance to share a request, and skipping the sort keeps
+    key building cheap on the hot path.
+
+    Args:
+        value: JSON-like request data
+
+    Returns:
+        Hashable equivalent of value
+    """
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str):
+        return value
+    # Keep the type so True, 1 and 1.0 (sent differently) stay distinct keys
+    return type(value), value if isinstance(value, Hashable) else repr(value)
+
+
+class _AsyncChunkReader:
+    """Minimal async file-like wrapper so ijson can read from a byte stream."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        """Return the next non-empty chunk of the body.
+
+        Args:
+            size: Requested size; only 0 is honored, otherwise a whole chunk is returned
+
+        Returns:
+            Next chunk of bytes, or b"" once the body is exhausted
+        """
+        if size == 0:  # ijson probes with read(0) to detect bytes vs str
+            return b""
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
 
 class AsyncHTTPTransport:
     """Async HTTP transport layer with automatic retry logic and caching.
@@ -44,6 +127,7 @@ class AsyncHTTPTransport:
         config: SDK configuration
         client: HTTPX async client with connection pooling
         cache_manager: Optional permission cache manager for caching
+        http_cache: Optional cache of GET responses honoring ETag/Cache-Control
 
     Example:
         >>> config = SDKConfig(base_url="https://api.example.com", api_key="key")
@@ -64,6 +148,11 @@ class AsyncHTTPTransport:
         self.client = self._create_client()
         self.cache_manager: PermissionCacheManager | None = None
         self._cache_initialized = False
+        self._base_prefix = config.base_url.rstrip("/") + "/"
+        self.http_cache: HTTPResponseCache | None = (
+            HTTPResponseCache(config.http_cache_maxsize) if config.http_cache_enabled else None
+        )
+        self._inflight: dict[Hashable, asyncio.Future[dict[str, Any]]] = {}
 
     def _create_client(self) -> httpx.AsyncClient:
         """Create configured async HTTP client with retry logic.
@@ -76,6 +165,8 @@ class AsyncHTTPTransport:
             - Authentication headers
             - Connection pooling
             - Timeout configuration
+            - HTTP/2 multiplexing (when enabled and ``h2`` is installed)
+            - TCP_NODELAY and SO_KEEPALIVE on pooled sockets
         """
         headers = {
             "X-API-Key": self.config.api_key,
@@ -87,13 +178,26 @@ class AsyncHTTPTransport:
         limits = httpx.Limits(
             max_keepalive_connections=self.config.pool_connections,
             max_connections=self.config.pool_maxsize,
+            keepalive_expiry=self.config.keepalive_expiry,
         )
 
         # Create async client with configuration
+        transport_options: dict[str, Any] = {
+            "limits": limits,
+            "http2": self.config.http2 and _HTTP2_AVAILABLE,
+            "socket_options": _SOCKET_OPTIONS,
+        }
+        # Passing a transport turns off httpx's HTTP(S)_PROXY/NO_PROXY handling,
+        # so mount the environment proxies with the same socket options
+        mounts: dict[str, httpx.AsyncBaseTransport | None] = {
+            pattern: httpx.AsyncHTTPTransport(proxy=proxy, **transport_options) if proxy else None
+            for pattern, proxy in get_environment_proxies().items()
+        }
         client = httpx.AsyncClient(
             headers=headers,
             timeout=httpx.Timeout(self.config.timeout),
-            limits=limits,
+            transport=httpx.AsyncHTTPTransport(**transport_options),
+            mounts=mounts,
             follow_redirects=True,
         )
 
@@ -114,58 +218,46 @@ class AsyncHTTPTransport:
                 self.cache_manager = PermissionCacheManager(
                     cache_service,
                     self.config.cache_prefix,
+                    l1_maxsize=(
+                        self.config.cache_l1_maxsize if self.config.cache_l1_enabled else 0
+                    ),
+                    l1_ttl=self.config.cache_l1_ttl,
                 )
                 logger.debug("Cache initialized successfully")
             except Exception as e:
                 logger.warning(
-                    f"Failed to initialize cache: {e}."
-                    " Continuing without cache.",
+                    "Failed to initialize cache: %s. Continuing without cache.",
+                    e,
                 )
                 self.cache_manager = None
 
         self._cache_initialized = True
 
-    def _is_check_request(self, method: str, endpoint: str) -> bool:
-        """Check if this is a permission check request.
+    def _route(self, method: str, endpoint: str) -> str | None:
+        """Classify a request for routing.
 
         Args:
             method: HTTP method
             endpoint: API endpoint
 
         Returns:
-            True if this is a check or check-many request
+            "check", "grant" or "revoke" for permission endpoints, None otherwise
         """
-        return method == "POST" and (
-            "/permissions/check" in endpoint or "/permissions/check-many" in endpoint
-        )
-
-    def _is_grant_request(self, method: str, endpoint: str) -> bool:
-        """Check if this is a grant request.
-
-        Args:
-            method: HTTP method
-            endpoint: API endpoint
-
-        Returns:
-            True if this is a grant or grant-many request
-        """
-        return method == "POST" and (
-            "/permissions/grant" in endpoint or "/permissions/grant-many" in endpoint
-        )
+        if method != "POST":
+            return None
+        return _PERMISSION_ROUTES.get(endpoint.rsplit("/api/v1", 1)[-1])
 
-    def _is_revoke_request(self, method: str, endpoint: str) -> bool:
-        """Check if this is a revoke request.
+    def _is_check_request(self, method: str, endpoint: str) -> bool:
+        """Check if this is a permission check request.
 
         Args:
             method: HTTP method
             endpoint: API endpoint
 
         Returns:
-            True if this is a revoke or revoke-many request
+            True if this is a check or check-many request
         """
-        return method == "POST" and (
-            "/permissions/revoke" in endpoint or "/permissions/revoke-many" in endpoint
-        )
+        return self._route(method, endpoint) == "check"
 
     async def request(
         self,
@@ -173,6 +265,7 @@ class AsyncHTTPTransport:
         endpoint: str,
         json: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """Make async HTTP request with error handling.
 
@@ -181,6 +274,8 @@ class AsyncHTTPTransport:
             endpoint: API endpoint path (e.g., '/api/v1/permissions/check')
             json: Optional JSON request body
             params: Optional query parameters
+            headers: Optional extra request headers. Sending an ``Idempotency-Key``
+                makes non-idempotent writes eligible for retries.
 
         Returns:
             Response data as dictionary
@@ -205,13 +300,171 @@ class AsyncHTTPTransport:
         await self._ensure_cache_initialized()
 
         # Route request based on type
-        if self._is_check_request(method, endpoint):
-            return await self._handle_check_request(method, endpoint, json, params)
-        elif self._is_grant_request(method, endpoint) or self._is_revoke_request(method, endpoint):
-            return await self._handle_mutation_request(method, endpoint, json, params)
+        # Reads are coalesced so identical concurrent calls share one round trip
+        route = self._route(method, endpoint)
+        if route == "check" or method == "GET":
+            read: Callable[[], Awaitable[dict[str, Any]]] = (
+                (lambda: self._handle_check_request(method, endpoint, json, params, headers))
+                if route == "check"
+                else (lambda: self._handle_cached_get(endpoint, params, headers))
+            )
+            if not self.config.coalesce_requests:
+                return await read()
+            return await self._single_flight(
+                self._request_key(method, endpoint, json, params, headers), read
+            )
+
+        # Any write may change cached listings
+        if self.http_cache is not None:
+            self.http_cache.clear()
+
+        if route is not None:
+            return await self._handle_mutation_request(method, endpoint, json, params, headers)
         else:
             # Pass through for other requests
-            return await self._do_request(method, endpoint, json, params)
+            return await self._do_request(method, endpoint, json, params, headers)
+
+    async def stream_items(
+        self,
+        method: str,
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        items_key: str = "items",
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over the items of a list response without buffering it whole.
+
+        With ``ijson`` installed the body is parsed incrementally as it arrives,
+        so peak memory stays flat for large pages. Without it the body is
+        decoded in one piece and its items are yielded. Streamed requests are
+        neither retried nor cached.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path (e.g., '/api/v1/permissions')
+            json: Optional JSON request body
+            params: Optional query parameters
+            headers: Optional extra request headers
+            items_key: Top-level key holding the list of items (default: "items")
+
+        Yields:
+            Each item of the list as a dictionary
+
+        Raises:
+            Same exceptions as request() for error responses
+
+        Example:
+            >>> async for item in transport.stream_items("GET", "/api/v1/permissions"):
+            ...     print(item["subject"])
+        """
+        content = json_dumps(json) if json is not None else None
+        try:
+            async with self.client.stream(
+                method,
+                self._build_url(endpoint),
+                content=content,
+                params=params,
+                headers=headers,
+            ) as response:
+                if not 200 <= response.status_code < 300:
+                    await response.aread()
+                    self._handle_response(response)
+
+                if ijson is None:
+                    await response.aread()
+                    for item in json_loads(response.content).get(items_key, []):
+                        yield item
+                    return
+
+                async for item in ijson.items_async(
+                    _AsyncChunkReader(response.aiter_bytes()),
+                    f"{items_key}.item",
+                    use_float=True,
+                ):
+                    yield item
+        except httpx.TimeoutException as e:
+            raise TimeoutError(
+                f"Request timed out after {self.config.timeout} seconds",
+                timeout=float(self.config.timeout),
+            ) from e
+        except httpx.NetworkError as e:
+            raise NetworkError(f"Failed to connect to {self.config.base_url}: {e}") from e
+
+    @staticmethod
+    def _request_key(
+        method: str,
+        endpoint: str,
+        json_data: dict[str, Any] | None,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> Hashable:
+        """Build a key identifying identical requests for coalescing."""
+        return method, endpoint, _freeze(json_data), _freeze(params), _freeze(headers)
+
+    async def _single_flight(
+        self, key: Hashable, call: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Run a read, sharing its result with identical concurrent reads.
+
+        The first caller for a key issues the request; callers arriving while
+        it is in flight await it instead of sending a duplicate request. Each
+        waiter gets its own copy of the result, or raises its own copy of the
+        exception chained to the original.
+        If the leader is interrupted rather than failing (KeyboardInterrupt,
+        cancellation), waiters send the request themselves instead.
+
+        Args:
+            key: Request key from _request_key()
+            call: Factory for the coroutine performing the request
+
+        Returns:
+            Response data
+        """
+        while (pending := self._inflight.get(key)) is not None:
+            try:
+                result = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The leading caller was cancelled; issue the request ourselves
+                if not pending.cancelled():
+                    raise
+            except Exception as e:
+                raise self._copy_error(e) from e
+            else:
+                return copy.deepcopy(result)
+
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await call()
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark as retrieved; waiters re-raise it themselves
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+            if not future.done():
+                future.cancel()
+
+    @staticmethod
+    def _copy_error(error: Exception) -> Exception:
+        """Copy a shared exception so each waiter raises its own instance.
+
+        The copy bypasses ``__init__`` (some SDK errors take extra arguments)
+        and starts without a traceback, so waiters never share one.
+
+        Args:
+            error: Exception raised by the leading request
+
+        Returns:
+            New exception of the same type with the same args and attributes
+        """
+        fresh = type(error).__new__(type(error), *error.args)
+        fresh.__dict__.update(error.__dict__)
+        return fresh
 
     async def _handle_check_request(
         self,
@@ -219,6 +472,7 @@ class AsyncHTTPTransport:
         endpoint: str,
         json_data: dict[str, Any] | None,
         params: dict[str, Any] | None,
+        headers: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """Handle check permission request with caching.
 
@@ -227,68 +481,198 @@ class AsyncHTTPTransport:
             endpoint: API endpoint
             json_data: Request JSON body
             params: Query parameters
+            headers: Extra request headers
 
         Returns:
             Response data
         """
         # If cache not enabled or no data, pass through
         if not self.cache_manager or not json_data:
-            return await self._do_request(method, endpoint, json_data, params)
+            return await self._do_request(method, endpoint, json_data, params, headers)
 
-        # Handle single check
-        if "/permissions/check-many" not in endpoint:
-            subjects = json_data.get("subjects", [])
-            scope = json_data.get("scope")
-            action = json_data.get("action")
-            tenant_id = json_data.get("tenant_id")
-            object_id = json_data.get("object_id")
-
-            # Skip cache if scope or action missing
-            if not scope or not action:
-                return await self._do_request(method, endpoint, json_data, params)
-
-            # Try cache first
-            try:
-                cached_result = await self.cache_manager.get_check_result(
-                    subjects, str(scope), str(action), tenant_id, object_id
-                )
+        if "/permissions/check-many" in endpoint:
+            return await self._handle_check_many_request(
+                method, endpoint, json_data, params, headers
+            )
 
-                if cached_result is not None:
-                    logger.debug(
-                        f"Cache hit for check: {subjects} -> {scope}.{action}",
-                        extra={"cache_hit": True},
-                    )
-                    return {"allowed": cached_result}
-            except Exception as e:
-                logger.warning(f"Cache get failed: {e}. Falling back to API call.")
+        # Handle single check
+        subjects = json_data.get("subjects", [])
+        scope = json_data.get("scope")
+        action = json_data.get("action")
+        tenant_id = json_data.get("tenant_id")
+        object_id = json_data.get("object_id")
+
+        # Skip cache if scope or action missing
+        if not scope or not action:
+            return await self._do_request(method, endpoint, json_data, params, headers)
+
+        # Build the key once for both the lookup and the store on a miss
+        key = self.cache_manager.build_check_key(
+            subjects, str(scope), str(action), tenant_id, object_id
+        )
 
-        # Cache miss or batch check - call API
-        result = await self._do_request(method, endpoint, json_data, params)
+        # Try cache first. The revisions it reads are stored with the result on a
+        # miss, so a grant or revoke during the API call invalidates that entry.
+        revisions: dict[str, int] | None = None
+        try:
+            cached_result, revisions = await self.cache_manager.get_check_result_by_key(
+                key, subjects
+            )
 
-        # Cache the result for single checks
-        if "/permissions/check-many" not in endpoint and self.cache_manager and scope and action:
-            try:
-                await self.cache_manager.set_check_result(
+            if cached_result is not None:
+                logger.debug(
+                    "Cache hit for check: %s -> %s.%s",
                     subjects,
-                    str(scope),
-                    str(action),
-                    result.get("allowed", False),
-                    tenant_id,
-                    object_id,
-                    ttl=self.config.cache_ttl,
+                    scope,
+                    action,
+                    extra={"cache_hit": True},
                 )
-                logger.debug(f"Cached check result for {subjects} -> {scope}.{action}")
-            except Exception as e:
-                logger.warning(f"Failed to cache check result: {e}")
+                return {"allowed": cached_result}
+        except Exception as e:
+            logger.warning("Cache get failed: %s. Falling back to API call.", e)
+
+        # Cache miss - call API
+        result = await self._do_request(method, endpoint, json_data, params, headers)
+
+        # Cache the result, unless the lookup failed and left no revisions to pin it to
+        if revisions is None:
+            return result
+        try:
+            await self.cache_manager.set_check_result_by_key(
+                key,
+                subjects,
+                result.get("allowed", False),
+                ttl=self.config.cache_ttl,
+                revisions=revisions,
+            )
+            logger.debug("Cached check result for %s -> %s.%s", subjects, scope, action)
+        except Exception as e:
+            logger.warning("Failed to cache check result: %s", e)
 
         return result
 
+    async def _handle_check_many_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: dict[str, Any],
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Handle batch check request, sending only cache misses to the API."""
+        cache_manager = self.cache_manager
+        checks = json_data.get("checks") or []
+        if (
+            cache_manager is None
+            or not checks
+            or not all(c.get("scope") and c.get("action") for c in checks)
+        ):
+            return await self._do_request(method, endpoint, json_data, params, headers)
+
+        revisions: dict[str, int] | None = None
+        try:
+            cached, revisions = await cache_manager.get_check_results_many(checks)
+        except Exception as e:
+            logger.warning("Cache get failed: %s. Falling back to API call.", e)
+            cached = [None] * len(checks)
+
+        misses = [i for i, allowed in enumerate(cached) if allowed is None]
+        results = [
+            {"allowed": allowed, "check_id": check.get("check_id")}
+            for check, allowed in zip(checks, cached, strict=True)
+        ]
+        logger.debug(
+            "Cache hits for batch check: %s/%s",
+            len(checks) - len(misses),
+            len(checks),
+            extra={"cache_hit": not misses},
+        )
+        if not misses:
+            return {"results": results}
+
+        miss_checks = [checks[i] for i in misses]
+        response = await self._do_request(
+            method, endpoint, {**json_data, "checks": miss_checks}, params, headers
+        )
+        fetched = response.get("results", [])
+        if len(fetched) != len(miss_checks):
+            # Unexpected response shape; only an unfiltered request can be trusted
+            if len(misses) == len(checks):
+                return response
+            return await self._do_request(method, endpoint, json_data, params, headers)
+
+        for i, result in zip(misses, fetched, strict=True):
+            results[i] = result
+
+        # Without the lookup's revisions the results cannot be stored safely
+        if revisions is None:
+            return {**response, "results": results}
+        try:
+            await cache_manager.set_check_results_many(
+                miss_checks,
+                [bool(r.get("allowed", False)) for r in fetched],
+                ttl=self.config.cache_ttl,
+                revisions=revisions,
+            )
+        except Exception as e:
+            logger.warning("Failed to cache check results: %s", e)
+
+        return {**response, "results": results}
+
+    async def _handle_cached_get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        """Handle GET request through the HTTP response cache.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            headers: Extra request headers
+
+        Returns:
+            Response data
+        """
+        if self.http_cache is None:
+            return await self._do_request("GET", endpoint, None, params, headers)
+
+        key = self.http_cache.make_key(endpoint, params)
+        entry = self.http_cache.get(key)
+
+        if entry is not None and entry.is_fresh:
+            logger.debug("HTTP cache hit for GET %s", endpoint, extra={"cache_hit": True})
+            # Hand out copies so callers cannot mutate the cached body
+            return copy.deepcopy(entry.body)
+
+        # Revalidate stale entries instead of downloading the body again
+        revalidating = False
+        if entry is not None and entry.etag:
+            headers = {**(headers or {}), "If-None-Match": entry.etag}
+            revalidating = True
+
+        response = await self._send_request(
+            "GET", endpoint, None, params, headers, revalidating=revalidating
+        )
+
+        if response.status_code == 304 and entry is not None:
+            self.http_cache.refresh(key, response)
+            return copy.deepcopy(entry.body)
+
+        body: dict[str, Any] = (
+            {} if response.status_code == 204 else json_loads(response.content)
+        )
+        self.http_cache.store(key, body, response)
+        return copy.deepcopy(body)
+
     async def _handle_mutation_request(
         self,
         method: str,
         endpoint: str,
         json_data: dict[str, Any] | None,
         params: dict[str, Any] | None,
+        headers: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """Handle grant/revoke request with cache invalidation.
 
@@ -297,19 +681,20 @@ class AsyncHTTPTransport:
             endpoint: API endpoint
             json_data: Request JSON body
             params: Query parameters
+            headers: Extra request headers
 
         Returns:
             Response data
         """
         # Call API first
-        result = await self._do_request(method, endpoint, json_data, params)
+        result = await self._do_request(method, endpoint, json_data, params, headers)
 
         # Invalidate cache if enabled
         if self.cache_manager and json_data:
             try:
                 await self._invalidate_cache_for_mutation(endpoint, json_data)
             except Exception as e:
-                logger.warning(f"Cache invalidation failed: {e}")
+                logger.warning("Cache invalidation failed: %s", e)
 
         return result
 
@@ -328,28 +713,24 @@ class AsyncHTTPTransport:
         # Handle batch operations
         if "/grant-many" in endpoint:
             grants = json_data.get("grants", [])
-            subjects = list({g.get("subject") for g in grants if g.get("subject")})
+            subjects = {g["subject"] for g in grants if g.get("subject")}
             if subjects:
-                invalidated = await self.cache_manager.invalidate_subjects(subjects)
-                logger.debug(
-                    f"Invalidated {invalidated} cache keys for batch grant ({len(subjects)} subjects)"
-                )
+                await self.cache_manager.bump_revisions(subjects)
+                logger.debug("Invalidated cache for batch grant (%s subjects)", len(subjects))
 
         elif "/revoke-many" in endpoint:
             revocations = json_data.get("revocations", [])
-            subjects = list({r.get("subject") for r in revocations if r.get("subject")})
+            subjects = {r["subject"] for r in revocations if r.get("subject")}
             if subjects:
-                invalidated = await self.cache_manager.invalidate_subjects(subjects)
-                logger.debug(
-                    f"Invalidated {invalidated} cache keys for batch revoke ({len(subjects)} subjects)"
-                )
+                await self.cache_manager.bump_revisions(subjects)
+                logger.debug("Invalidated cache for batch revoke (%s subjects)", len(subjects))
 
         # Handle single operations
         elif "/grant" in endpoint or "/revoke" in endpoint:
             subject = json_data.get("subject")
             if subject:
-                invalidated = await self.cache_manager.invalidate_subject(subject)
-                logger.debug(f"Invalidated {invalidated} cache keys for subject: {subject}")
+                await self.cache_manager.bump_revisions([subject])
+                logger.debug("Invalidated cache for subject: %s", subject)
 
     async def _do_request(
         self,
@@ -357,6 +738,7 @@ class AsyncHTTPTransport:
         endpoint: str,
         json: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> dict[str, Any]:
         """Perform the actual HTTP request with retry logic.
 
@@ -365,6 +747,7 @@ class AsyncHTTPTransport:
             endpoint: API endpoint
             json: Request JSON body
             params: Query parameters
+            headers: Extra request headers
 
         Returns:
             Response data
@@ -372,68 +755,221 @@ class AsyncHTTPTransport:
         Raises:
             Various SDK exceptions based on response status
         """
-        url = urljoin(self.config.base_url, endpoint)
+        response = await self._send_request(method, endpoint, json, params, headers)
+
+        # Return JSON response
+        if response.status_code == 204:  # No content
+            return {}
+
+        json_response: dict[str, Any] = json_loads(response.content)
+        return json_response
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        revalidating: bool = False,
+    ) -> httpx.Response:
+        """Send the HTTP request with retry logic.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            json: Request JSON body
+            params: Query parameters
+            headers: Extra request headers
+            revalidating: Whether the request is a conditional GET, so a 304 is
+                an expected answer rather than an error
+
+        Returns:
+            Successful (2xx, or 304 when revalidating) HTTP response
+
+        Raises:
+            Various SDK exceptions based on response status
+        """
+        url = self._build_url(endpoint)
+        max_retries = self.config.max_retries
+        retry_on_status = self.config.retry_on_status
+        retryable = self._is_retryable(method, endpoint, headers)
+        # Serialize the body once rather than on every attempt
+        content = json_dumps(json) if json is not None else None
+        deadline = (
+            time.monotonic() + self.config.total_deadline
+            if self.config.total_deadline is not None
+            else None
+        )
 
         # Implement retry logic manually since httpx doesn't have built-in retry
-        for attempt in range(self.config.max_retries + 1):
+        for attempt in range(max_retries + 1):
+            timeout = self._attempt_timeout(deadline)
             try:
                 response = await self.client.request(
                     method=method,
                     url=url,
-                    json=json,
+                    content=content,
                     params=params,
+                    headers=headers,
+                    timeout=timeout,
                 )
 
-                # Handle different status codes
-                self._handle_response(response)
-
-                # Return JSON response
-                if response.status_code == 204:  # No content
-                    return {}
+                # Retry retryable status codes while attempts remain. A 429 means
+                # the request was rejected unprocessed, so it is safe for any method.
+                if (
+                    response.status_code in retry_on_status
+                    and attempt < max_retries
+                    and (retryable or response.status_code == 429)
+                ):
+                    try:
+                        await self._wait_for_retry(
+                            attempt, self._get_retry_after(response), deadline
+                        )
+                    except TimeoutError:
+                        # Out of time: report what the server said, not a bare deadline
+                        self._handle_response(response)
+                        raise
+                    continue
 
-                json_response: dict[str, Any] = response.json()
-                return json_response
+                # Handle different status codes
+                if not (revalidating and response.status_code == 304):
+                    self._handle_response(response)
+                return response
 
             except httpx.TimeoutException as e:
-                if attempt == self.config.max_retries:
+                # A connect timeout means the request never reached the server
+                if attempt == max_retries or not (
+                    retryable or isinstance(e, httpx.ConnectTimeout)
+                ):
                     raise TimeoutError(
-                        f"Request timed out after {self.config.timeout} seconds",
-                        timeout=float(self.config.timeout),
+                        f"Request timed out after {timeout} seconds",
+                        timeout=float(timeout),
                     ) from e
                 # Retry on timeout
-                await self._wait_for_retry(attempt)
+                await self._wait_for_retry(attempt, deadline=deadline)
 
             except (httpx.ConnectError, httpx.NetworkError) as e:
-                if attempt == self.config.max_retries:
+                # A failed connect means the request never reached the server
+                if attempt == max_retries or not (
+                    retryable or isinstance(e, httpx.ConnectError)
+                ):
                     raise NetworkError(f"Failed to connect to {self.config.base_url}: {e}") from e
                 # Retry on network error
-                await self._wait_for_retry(attempt)
-
-            except httpx.HTTPStatusError as e:
-                # Check if status code is retryable
-                if (
-                    e.response.status_code in self.config.retry_on_status
-                    and attempt < self.config.max_retries
-                ):
-                    await self._wait_for_retry(attempt)
-                    continue
-                # Re-raise for non-retryable errors
-                self._handle_response(e.response)
+                await self._wait_for_retry(attempt, deadline=deadline)
 
         # Should not reach here, but for type safety
         raise ServerError("Maximum retries exceeded")
 
-    async def _wait_for_retry(self, attempt: int) -> None:
-        """Wait before retrying with exponential backoff.
+    def _build_url(self, endpoint: str) -> str:
+        """Build the absolute URL for an endpoint.
+
+        Plain concatenation avoids re-parsing both URLs with urljoin per call.
 
         Args:
-            attempt: Current attempt number (0-indexed)
+            endpoint: API endpoint path, or an absolute URL
+
+        Returns:
+            Absolute request URL
         """
-        import asyncio
+        if "://" in endpoint:
+            return urljoin(self.config.base_url, endpoint)
+        return self._base_prefix + endpoint.lstrip("/")
+
+    def _is_retryable(
+        self, method: str, endpoint: str, headers: dict[str, str] | None
+    ) -> bool:
+        """Check if a request is safe to resend after it may have reached the server.
 
-        wait_time = self.config.retry_backoff * (self.config.retry_multiplier**attempt)
+        Methods in ``retry_methods`` and permission checks are always safe to
+        resend; other writes opt in by sending an ``Idempotency-Key`` header.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            headers: Extra request headers
+
+        Returns:
+            True if the request may be retried
+        """
+        if method.upper() in self.config.retry_methods:
+            return True
+        if self._is_check_request(method, endpoint):
+            return True
+        return any(name.lower() == "idempotency-key" for name in headers or {})
+
+    def _attempt_timeout(self, deadline: float | None) -> float:
+        """Get the timeout for the next attempt, bounded by the request deadline.
+
+        Args:
+            deadline: Monotonic time by which the request must finish, if any
+
+        Returns:
+            Timeout in seconds for the next attempt
+
+        Raises:
+            TimeoutError: If the deadline has already passed
+        """
+        if deadline is None:
+            return self.config.timeout
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise self._deadline_exceeded()
+        return min(self.config.timeout, remaining)
+
+    def _deadline_exceeded(self) -> TimeoutError:
+        """Build the error raised when the request deadline runs out."""
+        total_deadline = float(self.config.total_deadline or 0)
+        return TimeoutError(
+            f"Request did not complete within the {total_deadline} second deadline",
+            timeout=total_deadline,
+        )
+
+    async def _wait_for_retry(
+        self, attempt: int, hint: float | None = None, deadline: float | None = None
+    ) -> None:
+        """Wait before retrying with capped, jittered exponential backoff.
+
+        The jitter keeps clients that failed together from retrying in lockstep.
+        A server-requested delay replaces the computed backoff entirely.
+
+        Args:
+            attempt: Current attempt number (0-indexed)
+            hint: Optional server-requested delay (from ``Retry-After``), used
+                as the wait time, still bounded by ``retry_max_delay``
+            deadline: Monotonic time by which the request must finish, if any
+
+        Raises:
+            TimeoutError: If waiting would run past the deadline
+        """
+        if hint is not None:
+            wait_time = min(hint, self.config.retry_max_delay)
+        else:
+            wait_time = min(
+                self.config.retry_max_delay,
+                self.config.retry_backoff * (self.config.retry_multiplier**attempt),
+            )
+            wait_time *= 1 + random.random() * self.config.retry_jitter
+        if deadline is not None and time.monotonic() + wait_time >= deadline:
+            raise self._deadline_exceeded()
         await asyncio.sleep(wait_time)
 
+    def _get_retry_after(self, response: httpx.Response) -> float | None:
+        """Extract the server-requested retry delay from a response.
+
+        Only 429 and 503 responses carry a meaningful ``Retry-After`` header.
+
+        Args:
+            response: HTTP response object
+
+        Returns:
+            Delay in seconds, or None if not provided
+        """
+        if response.status_code not in (429, 503):
+            return None
+        return parse_retry_after(response.headers.get("Retry-After"))
+
     def _handle_response(self, response: httpx.Response) -> None:
         """Handle HTTP response and raise appropriate exceptions.
 
@@ -448,71 +984,76 @@ class AsyncHTTPTransport:
             RateLimitError: For 429 status
             ServerError: For 500-599 status
         """
+        status_code = response.status_code
+
         # Success status codes
-        if 200 <= response.status_code < 300:
+        if 200 <= status_code < 300:
             return
 
-        # Try to extract error details from response
+        # Try to extract error details from response. Gateway errors (502/504)
+        # are often HTML or empty, so only decode bodies that claim to be JSON.
         error_data: dict | None = None
-        try:
-            error_data = response.json()
-            error_message = error_data.get("detail", response.text)
-            error_type = error_data.get("error_type")
-            error_field = error_data.get("field")
-        except Exception:
-            error_message = response.text or f"HTTP {response.status_code}"
-            error_type = None
-            error_field = None
+        error_message = response.text or f"HTTP {status_code}"
+        error_type = None
+        error_field = None
+        if "json" in response.headers.get("Content-Type", "") and response.content:
+            try:
+                error_data = json_loads(response.content)
+                error_message = error_data.get("detail", response.text)
+                error_type = error_data.get("error_type")
+                error_field = error_data.get("field")
+            except Exception:
+                error_data = None
 
         # Map status codes to exceptions
-        if response.status_code == 401:
+        if status_code == 401:
             raise AuthenticationError(
                 error_message or "Authentication failed - invalid API key",
-                status_code=response.status_code,
+                status_code=status_code,
             )
 
-        if response.status_code == 400:
+        if status_code == 400:
             raise ValidationError(
                 error_message or "Request validation failed",
                 field=error_field,
-                status_code=response.status_code,
+                status_code=status_code,
             )
 
-        if response.status_code == 404:
+        if status_code == 404:
             raise ResourceNotFoundError(
                 error_message or "Resource not found",
                 resource_type=error_type,
-                status_code=response.status_code,
+                status_code=status_code,
             )
 
-        if response.status_code == 409:
+        if status_code == 409:
             raise ConflictError(
                 error_message or "Resource conflict occurred",
                 response=error_data,
-                status_code=response.status_code,
+                status_code=status_code,
             )
 
-        if response.status_code == 429:
+        if status_code == 429:
             # Try to get retry-after header
-            retry_after = response.headers.get("Retry-After")
-            retry_after_seconds = int(retry_after) if retry_after else None
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            retry_after_seconds = math.ceil(retry_after) if retry_after is not None else None
 
             raise RateLimitError(
                 error_message or "Rate limit exceeded",
                 retry_after=retry_after_seconds,
-                status_code=response.status_code,
+                status_code=status_code,
             )
 
-        if response.status_code >= 500:
+        if status_code >= 500:
             raise ServerError(
                 error_message or "Internal server error",
-                status_code=response.status_code,
+                status_code=status_code,
             )
 
         # Fallback for any other error status codes
         raise ServerError(
-            error_message or f"Unexpected error: HTTP {response.status_code}",
-            status_code=response.status_code,
+            error_message or f"Unexpected error: HTTP {status_code}",
+            status_code=status_code,
         )
 
     async def close(self) -> None:
@@ -536,7 +1077,7 @@ class AsyncHTTPTransport:
             try:
                 await self.cache_manager.close()
             except Exception as e:
-                logger.warning(f"Failed to close cache: {e}")
+                logger.warning("Failed to close cache: %s", e)
 
     async def __aenter__(self) -> "AsyncHTTPTransport":
         """Async context manager entry.
@@ -5,12 +5,14 @@ network calls and improve performance.
 """
 
 from permission_sdk.cache.base import CacheService
+from permission_sdk.cache.http_cache import HTTPResponseCache
 from permission_sdk.cache.memory import InMemoryCacheService
 from permission_sdk.cache.noop import NoOpCacheService
 from permission_sdk.cache.redis import RedisCacheService
 
 __all__ = [
     "CacheService",
+    "HTTPResponseCache",
     "InMemoryCacheService",
     "NoOpCacheService",
     "RedisCacheService",
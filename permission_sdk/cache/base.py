@@ -25,6 +25,17 @@ class CacheService(Protocol):
         """
         ...
 
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        """Retrieve multiple values from cache in one operation.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Values in the same order as keys, None for missing keys
+        """
+        ...
+
     async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
         """Store a value in cache.
 
@@ -38,6 +49,18 @@ class CacheService(Protocol):
         """
         ...
 
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> bool:
+        """Store multiple values in cache in one operation.
+
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Time-to-live in seconds applied to every key (None for no expiration)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        ...
+
     async def delete(self, key: str) -> bool:
         """Delete a single key from cache.
 
@@ -60,6 +83,20 @@ class CacheService(Protocol):
         """
         ...
 
+    async def increment_many(self, keys: list[str], ttl: int | None = None) -> list[int]:
+        """Increment multiple integer counters in one operation.
+
+        Missing counters start from 0.
+
+        Args:
+            keys: Counter keys to increment
+            ttl: Optional time-to-live in seconds, refreshed on each increment
+
+        Returns:
+            New counter values in the same order as keys
+        """
+        ...
+
     async def exists(self, key: str) -> bool:
         """Check if a key exists in cache.
 
@@ -0,0 +1,163 @@
+"""HTTP response cache for idempotent GET requests.
+
+This module provides a small in-process cache that honors the server's
+``Cache-Control: max-age`` and ``ETag`` headers, so repeated list/get
+calls can be served locally or revalidated with a cheap 304 response.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+HTTPCacheKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+@dataclass
+class HTTPCacheEntry:
+    """A cached GET response body with its validators.
+
+    Attributes:
+        body: Decoded JSON response body
+        etag: Entity tag sent by the server, if any
+        expires_at: Monotonic time after which the entry must be revalidated
+    """
+
+    body: dict[str, Any]
+    etag: str | None
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        """Check if the entry can be served without contacting the server."""
+        return time.monotonic() < self.expires_at
+
+
+def _parse_max_age(cache_control: str) -> tuple[float, bool]:
+    """Parse a Cache-Control header value.
+
+    Args:
+        cache_control: Raw ``Cache-Control`` header value
+
+    Returns:
+        Tuple of (max-age in seconds, whether the response may be stored)
+    """
+    max_age = 0.0
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        name = name.lower()
+        if name in ("no-store", "private"):
+            return 0.0, False
+        if name == "no-cache":
+            max_age = 0.0
+            break
+        if name == "max-age":
+            try:
+                max_age = max(0.0, float(value.strip('"')))
+            except ValueError:
+                max_age = 0.0
+    return max_age, True
+
+
+class HTTPResponseCache:
+    """Bounded LRU cache of GET responses keyed by URL and query parameters.
+
+    Entries are stored only when the response carries a positive ``max-age``
+    or an ``ETag``. Fresh entries are served directly; stale entries with an
+    ETag are revalidated with ``If-None-Match``.
+
+    Example:
+        >>> cache = HTTPResponseCache(maxsize=128)
+        >>> key = cache.make_key("/api/v1/subjects", {"limit": 10})
+        >>> cache.get(key)  # None until a response is stored
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize the response cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the oldest
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[HTTPCacheKey, HTTPCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict[str, Any] | None) -> HTTPCacheKey:
+        """Build a cache key for a GET request.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Hashable cache key
+        """
+        return endpoint, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+
+    def get(self, key: HTTPCacheKey) -> HTTPCacheEntry | None:
+        """Look up a cached entry, fresh or stale.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The cached entry, or None if not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: HTTPCacheKey, body: dict[str, Any], response: httpx.Response) -> None:
+        """Store a response body if its headers allow caching.
+
+        Args:
+            key: Cache key from make_key()
+            body: Decoded JSON response body
+            response: The HTTP response carrying the caching headers
+        """
+        max_age, storable = _parse_max_age(response.headers.get("Cache-Control", ""))
+        etag = response.headers.get("ETag")
+        if not storable or (max_age <= 0 and etag is None):
+            with self._lock:
+                self._entries.pop(key, None)
+            return
+
+        entry = HTTPCacheEntry(body=body, etag=etag, expires_at=time.monotonic() + max_age)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def refresh(self, key: HTTPCacheKey, response: httpx.Response) -> HTTPCacheEntry | None:
+        """Extend a cached entry after a 304 Not Modified response.
+
+        Args:
+            key: Cache key from make_key()
+            response: The 304 response carrying updated caching headers
+
+        Returns:
+            The refreshed entry, or None if it was evicted meanwhile
+        """
+        max_age, _ = _parse_max_age(response.headers.get("Cache-Control", ""))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires_at = time.monotonic() + max_age
+                entry.etag = response.headers.get("ETag", entry.etag)
+            return entry
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
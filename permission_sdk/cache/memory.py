@@ -46,6 +46,17 @@ class InMemoryCacheService:
 
         return value
 
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        """Retrieve multiple values from cache.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Values in the same order as keys, None for missing or expired keys
+        """
+        return [await self.get(key) for key in keys]
+
     async def set(
         self, key: str, value: Any, ttl: int | None = None
     ) -> bool:
@@ -63,6 +74,20 @@ class InMemoryCacheService:
         self._cache[key] = (value, expires_at)
         return True
 
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> bool:
+        """Store multiple values in cache.
+
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Time-to-live in seconds applied to every key (None for no expiration)
+
+        Returns:
+            True (always successful for in-memory cache)
+        """
+        for key, value in items.items():
+            await self.set(key, value, ttl=ttl)
+        return True
+
     async def delete(self, key: str) -> bool:
         """Delete a single key from cache.
 
@@ -97,6 +122,23 @@ class InMemoryCacheService:
 
         return len(matching_keys)
 
+    async def increment_many(self, keys: list[str], ttl: int | None = None) -> list[int]:
+        """Increment multiple integer counters.
+
+        Args:
+            keys: Counter keys to increment
+            ttl: Optional time-to-live in seconds, refreshed on each increment
+
+        Returns:
+            New counter values in the same order as keys
+        """
+        values = []
+        for key in keys:
+            value = int(await self.get(key) or 0) + 1
+            await self.set(key, value, ttl=ttl)
+            values.append(value)
+        return values
+
     async def exists(self, key: str) -> bool:
         """Check if a key exists in cache.
 
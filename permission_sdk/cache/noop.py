@@ -27,6 +27,17 @@ class NoOpCacheService:
         """
         return None
 
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        """Always returns misses.
+
+        Args:
+            keys: Cache keys (ignored)
+
+        Returns:
+            None for every key
+        """
+        return [None] * len(keys)
+
     async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
         """Does nothing, always succeeds.
 
@@ -40,6 +51,18 @@ class NoOpCacheService:
         """
         return True
 
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> bool:
+        """Does nothing, always succeeds.
+
+        Args:
+            items: Mapping of cache keys to values (ignored)
+            ttl: TTL (ignored)
+
+        Returns:
+            True
+        """
+        return True
+
     async def delete(self, key: str) -> bool:
         """Does nothing, always returns False.
 
@@ -62,6 +85,18 @@ class NoOpCacheService:
         """
         return 0
 
+    async def increment_many(self, keys: list[str], ttl: int | None = None) -> list[int]:
+        """Does nothing, always returns zeros.
+
+        Args:
+            keys: Counter keys (ignored)
+            ttl: TTL (ignored)
+
+        Returns:
+            0 for every key
+        """
+        return [0] * len(keys)
+
     async def exists(self, key: str) -> bool:
         """Always returns False.
 
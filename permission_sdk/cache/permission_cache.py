@@ -7,6 +7,9 @@ specifically for the permission system with invalidation logic.
 import hashlib
 import json
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Collection
 from typing import Any
 from permission_sdk.cache.base import CacheService
 
@@ -21,19 +24,46 @@ class PermissionCacheManager:
     - Cache key generation with proper serialization
     - Getting/setting permission check results
     - Cache invalidation strategies for grant/revoke operations
+    - An optional in-process L1 layer in front of the cache service
+
+    Each subject has a revision counter in the cache. Check results are stored
+    together with the revisions of their subjects at write time, and a read
+    rejects any entry whose revisions no longer match. Bumping a subject's
+    revision therefore invalidates all of its cached checks with one increment.
+    Revision counters are stored without a TTL: an expired counter would read
+    as 0 again and revive entries written before the bump. Callers that check
+    the cache before an API call should store the result under the revisions
+    read by that lookup, so a bump made while the call was in flight still
+    invalidates it.
+
+    The L1 layer answers repeated checks with a dictionary lookup instead of
+    a round-trip to the cache backend. It only sees invalidations made through
+    this manager, so with a shared backend (Redis) other processes' grants and
+    revokes become visible here after at most ``l1_ttl`` seconds.
     """
 
-    def __init__(self, cache: CacheService, prefix: str = "perm_sdk") -> None:
+    def __init__(
+        self,
+        cache: CacheService,
+        prefix: str = "perm_sdk",
+        l1_maxsize: int = 0,
+        l1_ttl: float = 5.0,
+    ) -> None:
         """Initialize the permission cache manager.
 
         Args:
             cache: The cache service to use
             prefix: Cache key prefix (default: "perm_sdk")
+            l1_maxsize: Maximum entries in the in-process L1 layer (default: 0, disabled)
+            l1_ttl: Time-to-live of L1 entries in seconds (default: 5.0)
         """
         self.cache = cache
         self.prefix = prefix
+        self.l1_maxsize = l1_maxsize
+        self.l1_ttl = l1_ttl
+        self._l1: OrderedDict[str, tuple[bool, float]] = OrderedDict()
 
-    def _build_check_key(
+    def build_check_key(
         self,
         subjects: list[str],
         scope: str,
@@ -128,6 +158,68 @@ class PermissionCacheManager:
         """
         return f"{self.prefix}:check:*{subject}*"
 
+    def _build_revision_key(self, subject: str) -> str:
+        """Build the cache key holding a subject's revision counter.
+
+        Args:
+            subject: Subject identifier
+
+        Returns:
+            Cache key string (e.g., "perm_sdk:rev:user:123")
+        """
+        return f"{self.prefix}:rev:{subject}"
+
+    def _l1_get(self, key: str) -> bool | None:
+        """Look up a check result in the L1 layer.
+
+        Args:
+            key: Check cache key
+
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
+
+        result, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._l1[key]
+            return None
+
+        self._l1.move_to_end(key)
+        return result
+
+    def _l1_set(self, key: str, result: bool, ttl: float | None = None) -> None:
+        """Store a check result in the L1 layer, evicting the oldest entries.
+
+        Args:
+            key: Check cache key
+            result: Check result
+            ttl: Backend TTL; the L1 entry never outlives it
+        """
+        if self.l1_maxsize <= 0:
+            return
+
+        l1_ttl = self.l1_ttl if ttl is None else min(self.l1_ttl, ttl)
+        self._l1[key] = (result, time.monotonic() + l1_ttl)
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.l1_maxsize:
+            self._l1.popitem(last=False)
+
+    def _l1_invalidate_subjects(self, subjects: Collection[str]) -> None:
+        """Drop L1 entries involving any of the subjects in a single pass.
+
+        Mirrors _build_subject_pattern() for each subject.
+
+        Args:
+            subjects: Subject identifiers
+        """
+        if not self._l1 or not subjects:
+            return
+        for key in [key for key in self._l1 if any(s in key for s in subjects)]:
+            del self._l1[key]
+
     async def get_check_result(
         self,
         subjects: list[str],
@@ -148,20 +240,50 @@ class PermissionCacheManager:
         Returns:
             Cached result (True/False) or None if not cached
         """
-        key = self._build_check_key(
+        key = self.build_check_key(
             subjects,
             scope,
             action,
             tenant_id,
             object_id,
         )
-        result = await self.cache.get(key)
+        result, _ = await self.get_check_result_by_key(key, subjects)
+        return result
 
-        # Ensure we only return bool or None
-        if result is None:
-            return None
+    async def get_check_result_by_key(
+        self, key: str, subjects: list[str]
+    ) -> tuple[bool | None, dict[str, int]]:
+        """Get cached permission check result for a precomputed key.
 
-        return bool(result)
+        Lets callers build the key once and reuse it, together with the
+        returned revisions, for the matching set_check_result_by_key() call
+        on a miss.
+
+        Args:
+            key: Cache key from build_check_key()
+            subjects: Subject identifiers the key was built from
+
+        Returns:
+            Tuple of the cached result (True/False, or None if not cached) and
+            the subject revisions read by the lookup (empty on an L1 hit)
+        """
+        l1_result = self._l1_get(key)
+        if l1_result is not None:
+            return l1_result, {}
+
+        ordered = sorted(subjects)
+        rev_keys = [self._build_revision_key(subject) for subject in ordered]
+        entry, *values = await self.cache.get_many([key, *rev_keys])
+        revs = [rev or 0 for rev in values]
+        revisions = dict(zip(ordered, revs, strict=True))
+
+        # Entries written under an older revision of any subject are stale
+        if not isinstance(entry, dict) or entry.get("revs") != revs:
+            return None, revisions
+
+        result = bool(entry.get("allowed"))
+        self._l1_set(key, result)
+        return result, revisions
 
     async def set_check_result(
         self,
@@ -187,14 +309,154 @@ class PermissionCacheManager:
         Returns:
             True if cached successfully
         """
-        key = self._build_check_key(
+        key = self.build_check_key(
             subjects,
             scope,
             action,
             tenant_id,
             object_id,
         )
-        return await self.cache.set(key, result, ttl=ttl)
+        return await self.set_check_result_by_key(key, subjects, result, ttl=ttl)
+
+    async def set_check_result_by_key(
+        self,
+        key: str,
+        subjects: list[str],
+        result: bool,
+        ttl: int | None = None,
+        revisions: dict[str, int] | None = None,
+    ) -> bool:
+        """Cache a permission check result under a precomputed key.
+
+        Args:
+            key: Cache key from build_check_key()
+            subjects: Subject identifiers the key was built from
+            result: Check result to cache
+            ttl: Time-to-live in seconds
+            revisions: Subject revisions returned by the lookup that preceded
+                the API call. If omitted, the current revisions are read now.
+
+        Returns:
+            True if cached successfully
+        """
+        # With a snapshot, L1 is left to the next validated read: a local bump
+        # during the API call has already cleared it and must not be undone here
+        if revisions is None:
+            revisions = await self._get_revisions(set(subjects))
+            self._l1_set(key, result, ttl)
+
+        entry = {"allowed": result, "revs": [revisions[s] for s in sorted(subjects)]}
+        return await self.cache.set(key, entry, ttl=ttl)
+
+    def _build_check_keys(self, checks: list[dict]) -> list[str]:
+        """Build single-check cache keys for each item of a batch.
+
+        Args:
+            checks: List of check request dictionaries
+
+        Returns:
+            Cache keys in the same order as checks
+        """
+        return [
+            self.build_check_key(
+                check.get("subjects", []),
+                str(check.get("scope")),
+                str(check.get("action")),
+                check.get("tenant_id"),
+                check.get("object_id"),
+            )
+            for check in checks
+        ]
+
+    async def _get_revisions(self, subjects: set[str]) -> dict[str, int]:
+        """Read the current revision of each subject.
+
+        Args:
+            subjects: Subject identifiers
+
+        Returns:
+            Mapping of subject to revision (0 if never bumped)
+        """
+        ordered = sorted(subjects)
+        if not ordered:
+            return {}
+        revs = await self.cache.get_many([self._build_revision_key(s) for s in ordered])
+        return {subject: rev or 0 for subject, rev in zip(ordered, revs, strict=True)}
+
+    async def get_check_results_many(
+        self, checks: list[dict]
+    ) -> tuple[list[bool | None], dict[str, int]]:
+        """Get cached results for each item of a batch permission check.
+
+        Items share cache entries with single checks, so a batch can be served
+        from results cached by earlier check() calls and vice versa. All
+        entries and subject revisions are fetched with one get_many().
+
+        Args:
+            checks: List of check request dictionaries
+
+        Returns:
+            Tuple of the cached result (True/False) or None per check, in the
+            same order, and the revisions of the subjects of every miss, to be
+            passed to set_check_results_many()
+        """
+        keys = self._build_check_keys(checks)
+        results: list[bool | None] = [self._l1_get(key) for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return results, {}
+
+        subjects = sorted({s for i in misses for s in checks[i].get("subjects", [])})
+        rev_keys = [self._build_revision_key(subject) for subject in subjects]
+        values = await self.cache.get_many([keys[i] for i in misses] + rev_keys)
+        revisions = {
+            subject: rev or 0 for subject, rev in zip(subjects, values[len(misses) :], strict=True)
+        }
+
+        for i, entry in zip(misses, values[: len(misses)], strict=True):
+            expected = [revisions[s] for s in sorted(checks[i].get("subjects", []))]
+            if isinstance(entry, dict) and entry.get("revs") == expected:
+                allowed = bool(entry.get("allowed"))
+                results[i] = allowed
+                self._l1_set(keys[i], allowed)
+
+        return results, revisions
+
+    async def set_check_results_many(
+        self,
+        checks: list[dict],
+        results: list[bool],
+        ttl: int | None = None,
+        revisions: dict[str, int] | None = None,
+    ) -> bool:
+        """Cache results for each item of a batch permission check.
+
+        Args:
+            checks: List of check request dictionaries
+            results: Check results in the same order as checks
+            ttl: Time-to-live in seconds
+            revisions: Subject revisions returned by get_check_results_many()
+                before the API call. If omitted, the current revisions are read now.
+
+        Returns:
+            True if cached successfully
+        """
+        keys = self._build_check_keys(checks)
+        # As in set_check_result_by_key(), only fill L1 without a snapshot
+        fill_l1 = revisions is None
+        if revisions is None:
+            revisions = await self._get_revisions(
+                {s for check in checks for s in check.get("subjects", [])}
+            )
+
+        entries = {}
+        for key, check, result in zip(keys, checks, results, strict=True):
+            if fill_l1:
+                self._l1_set(key, result, ttl)
+            revs = [revisions[s] for s in sorted(check.get("subjects", []))]
+            entries[key] = {"allowed": result, "revs": revs}
+
+        return await self.cache.set_many(entries, ttl=ttl)
 
     async def get_check_many_result(
         self,
@@ -234,6 +496,32 @@ class PermissionCacheManager:
 
         return await self.cache.set(key, results, ttl=ttl)
 
+    async def bump_revisions(self, subjects: Collection[str]) -> list[int]:
+        """Invalidate all cached checks for subjects by bumping their revisions.
+
+        This is called when permissions are granted or revoked. Unlike
+        invalidate_subjects(), the cost depends only on the number of
+        subjects, not on how many check results are cached for them.
+
+        Args:
+            subjects: List of subject identifiers to invalidate
+
+        Returns:
+            New revision numbers in the same order as subjects
+        """
+        self._l1_invalidate_subjects(subjects)
+
+        rev_keys = [self._build_revision_key(subject) for subject in subjects]
+        revisions = await self.cache.increment_many(rev_keys)
+
+        logger.debug(
+            "Bumped cache revisions for %s subjects",
+            len(subjects),
+            extra={"subject_count": len(subjects)},
+        )
+
+        return revisions
+
     async def invalidate_subject(self, subject: str) -> int:
         """Invalidate all cached checks for a subject.
 
@@ -247,11 +535,14 @@ class PermissionCacheManager:
         Returns:
             Number of keys deleted
         """
+        self._l1_invalidate_subjects([subject])
         pattern = self._build_subject_pattern(subject)
         deleted = await self.cache.delete_pattern(pattern)
 
         logger.debug(
-            f"Invalidated {deleted} cache keys for subject: {subject}",
+            "Invalidated %s cache keys for subject: %s",
+            deleted,
+            subject,
             extra={"subject": subject, "keys_deleted": deleted},
         )
 
@@ -274,8 +565,9 @@ class PermissionCacheManager:
             total_deleted += deleted
 
         logger.debug(
-            f"Invalidated {total_deleted} cache "
-            f"keys for {len(subjects)} subjects",
+            "Invalidated %s cache keys for %s subjects",
+            total_deleted,
+            len(subjects),
             extra={
                 "subject_count": len(subjects),
                 "keys_deleted": total_deleted,
@@ -292,11 +584,13 @@ class PermissionCacheManager:
         Returns:
             Number of keys deleted
         """
+        self._l1.clear()
         pattern = f"{self.prefix}:check:*"
         deleted = await self.cache.delete_pattern(pattern)
 
         logger.info(
-            f"Invalidated all permission check caches: {deleted} keys deleted",
+            "Invalidated all permission check caches: %s keys deleted",
+            deleted,
             extra={"keys_deleted": deleted},
         )
 
@@ -308,6 +602,7 @@ class PermissionCacheManager:
         Returns:
             True if successful
         """
+        self._l1.clear()
         return await self.cache.clear()
 
     async def close(self) -> None:
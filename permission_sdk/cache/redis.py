@@ -59,6 +59,29 @@ class RedisCacheService:
             )
             return None
 
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        """Retrieve multiple values from cache with a single MGET.
+
+        Args:
+            keys: Cache keys to retrieve
+
+        Returns:
+            Values in the same order as keys, None for missing keys
+        """
+        if not keys:
+            return []
+
+        try:
+            values = await self.redis.mget(keys)
+            return [json.loads(value) if value is not None else None for value in values]
+
+        except (RedisError, ValueError) as e:
+            logger.warning(
+                f"Redis MGET error for {len(keys)} keys: {e}",
+                extra={"key_count": len(keys), "operation": "mget"},
+            )
+            return [None] * len(keys)
+
     async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
         """Store a value in cache.
 
@@ -92,6 +115,35 @@ class RedisCacheService:
             )
             return False
 
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> bool:
+        """Store multiple values in cache in one pipelined round-trip.
+
+        Args:
+            items: Mapping of cache keys to values (must be JSON-serializable)
+            ttl: Time-to-live in seconds applied to every key (None for no expiration)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not items:
+            return True
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(key, json.dumps(value), ex=ttl)
+                await pipe.execute()
+
+            return True
+
+        except (RedisError, TypeError, ValueError) as e:
+            # TypeError/ValueError from JSON serialization
+            logger.warning(
+                f"Redis MSET error for {len(items)} keys: {e}",
+                extra={"key_count": len(items), "operation": "mset"},
+            )
+            return False
+
     async def delete(self, key: str) -> bool:
         """Delete a single key from cache.
 
@@ -154,6 +206,36 @@ class RedisCacheService:
             )
             return 0
 
+    async def increment_many(self, keys: list[str], ttl: int | None = None) -> list[int]:
+        """Increment multiple integer counters in one pipelined round-trip.
+
+        Args:
+            keys: Counter keys to increment
+            ttl: Optional time-to-live in seconds, refreshed on each increment
+
+        Returns:
+            New counter values in the same order as keys (empty on error)
+        """
+        if not keys:
+            return []
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.incr(key)
+                    if ttl is not None:
+                        pipe.expire(key, ttl)
+                results = await pipe.execute()
+
+            return results[::2] if ttl is not None else results
+
+        except RedisError as e:
+            logger.warning(
+                f"Redis INCR error for {len(keys)} keys: {e}",
+                extra={"key_count": len(keys), "operation": "incr"},
+            )
+            return []
+
     async def exists(self, key: str) -> bool:
         """Check if a key exists in cache.
 
@@ -8,6 +8,7 @@ from typing import Any
 from urllib.parse import quote
 
 from permission_sdk.config import SDKConfig
+from permission_sdk.exceptions import PermissionSDKError
 from permission_sdk.models import (
     CheckAndIncrementManyResult,
     CheckAndIncrementResult,
@@ -104,6 +105,7 @@ class PermissionClient:
         object_id: str | None = None,
         expires_at: str | None = None,
         metadata: dict[str, Any] | None = None,
+        idempotency_key: str | None = None,
     ) -> PermissionAssignment:
         """Grant a permission to a subject.
 
@@ -118,6 +120,8 @@ class PermissionClient:
             object_id: Optional object identifier for object-level permissions
             expires_at: Optional expiration datetime (ISO 8601 format)
             metadata: Optional metadata dictionary
+            idempotency_key: Optional ``Idempotency-Key`` for the request; with it the
+                server can deduplicate resends, so transient failures are retried
 
         Returns:
             PermissionAssignment with details of the granted permission
@@ -154,11 +158,14 @@ class PermissionClient:
             "POST",
             "/api/v1/permissions/grant",
             json=request_data,
+            headers={"Idempotency-Key": idempotency_key} if idempotency_key else None,
         )
 
         return PermissionAssignment(**response)
 
-    def grant_many(self, grants: list[GrantRequest]) -> GrantManyResult:
+    def grant_many(
+        self, grants: list[GrantRequest], idempotency_key: str | None = None
+    ) -> GrantManyResult:
         """Grant multiple permissions in batch.
 
         Optimized for performance by batching operations. More efficient
@@ -166,6 +173,8 @@ class PermissionClient:
 
         Args:
             grants: List of grant requests
+            idempotency_key: Optional ``Idempotency-Key`` for the request; with it the
+                server can deduplicate resends, so transient failures are retried
 
         Returns:
             GrantManyResult with count and details of granted permissions
@@ -202,6 +211,7 @@ class PermissionClient:
             "POST",
             "/api/v1/permissions/grant-many",
             json=request_data,
+            headers={"Idempotency-Key": idempotency_key} if idempotency_key else None,
         )
 
         return GrantManyResult(
@@ -216,6 +226,7 @@ class PermissionClient:
         action: str,
         tenant_id: str | None = None,
         object_id: str | None = None,
+        idempotency_key: str | None = None,
     ) -> bool:
         """Revoke a permission from a subject.
 
@@ -225,6 +236,8 @@ class PermissionClient:
             action: Permission action
             tenant_id: Optional tenant identifier
             object_id: Optional object identifier
+            idempotency_key: Optional ``Idempotency-Key`` for the request; with it the
+                server can deduplicate resends, so transient failures are retried
 
         Returns:
             True if permission was revoked, False if it didn't exist
@@ -259,15 +272,20 @@ class PermissionClient:
             "POST",
             "/api/v1/permissions/revoke",
             json=request_data,
+            headers={"Idempotency-Key": idempotency_key} if idempotency_key else None,
         )
 
         return response.get("revoked", False)
 
-    def revoke_many(self, revocations: list[RevokeRequest]) -> int:
+    def revoke_many(
+        self, revocations: list[RevokeRequest], idempotency_key: str | None = None
+    ) -> int:
         """Revoke multiple permissions in batch.
 
         Args:
             revocations: List of revocation requests
+            idempotency_key: Optional ``Idempotency-Key`` for the request; with it the
+                server can deduplicate resends, so transient failures are retried
 
         Returns:
             Number of permissions revoked
@@ -304,6 +322,7 @@ class PermissionClient:
             "POST",
             "/api/v1/permissions/revoke-many",
             json=request_data,
+            headers={"Idempotency-Key": idempotency_key} if idempotency_key else None,
         )
 
         return response.get("revoked_count", 0)
@@ -381,6 +400,8 @@ class PermissionClient:
             ValidationError: If any check request is invalid
             AuthenticationError: If API key is invalid
             ServerError: If server error occurs
+            PermissionSDKError: If the server returns a result count that does not
+                match the checks sent
 
         Example:
             >>> checks = [
@@ -401,7 +422,9 @@ class PermissionClient:
             >>> for result in results:
             ...     print(f"{result.check_id}: {result.allowed}")
         """
-        request_data = {"checks": [c.model_dump(exclude_none=True) for c in checks]}
+        # Identical checks are sent once and fanned back out to every position
+        unique_checks = list(dict.fromkeys(checks))
+        request_data = {"checks": [c.model_dump(exclude_none=True) for c in unique_checks]}
 
         response = self.transport.request(
             "POST",
@@ -409,7 +432,17 @@ class PermissionClient:
             json=request_data,
         )
 
-        return [CheckResult(**r) for r in response.get("results", [])]
+        results = [CheckResult(**r) for r in response.get("results", [])]
+        if len(results) != len(unique_checks):
+            raise PermissionSDKError(
+                f"Batch check returned {len(results)} results for "
+                f"{len(unique_checks)} checks"
+            )
+        if len(unique_checks) == len(checks):
+            return results
+
+        results_by_check = dict(zip(unique_checks, results, strict=True))
+        return [results_by_check[c] for c in checks]
 
     def list_permissions(
         self, filters: PermissionFilter | None = None
@@ -24,14 +24,31 @@ class SDKConfig:
         retry_backoff: Initial backoff time between retries in seconds (default: 0.5)
         retry_multiplier: Backoff multiplier for exponential backoff (default: 2.0)
         retry_on_status: HTTP status codes that trigger a retry
+        retry_max_delay: Upper bound for the exponential backoff in seconds (default: 30.0)
+        retry_jitter: Random jitter fraction added to each backoff (default: 0.5)
+        total_deadline: Upper bound in seconds for a request including all retries
+            (default: None, bounded only by timeout and retry settings)
+        retry_methods: HTTP methods that are always safe to retry. Other writes are
+            only retried when they carry an ``Idempotency-Key`` header
         pool_maxsize: Maximum number of connections in the pool (default: 10)
         pool_connections: Number of connection pools to maintain (default: 10)
+        keepalive_expiry: Seconds an idle pooled connection is kept open (default: 30.0)
+        share_connection_pool: Reuse one process-wide HTTP client across sync transports
+            with the same settings (default: False)
+        http2: Negotiate HTTP/2 when the ``h2`` package is installed (default: True)
+        coalesce_requests: Share one in-flight round trip between identical concurrent
+            checks and GETs (default: True)
         validate_identifiers: Enable client-side identifier validation (default: True)
         cache_enabled: Enable SDK-side caching (default: False)
         cache_type: Cache backend type - "redis", "memory", or "none" (default: "redis")
         cache_redis_url: Redis URL for cache (required if cache_type="redis")
         cache_ttl: Cache time-to-live in seconds (default: 300 / 5 minutes)
         cache_prefix: Cache key prefix (default: "perm_sdk")
+        cache_l1_enabled: Keep an in-process L1 copy of check results (default: False)
+        cache_l1_maxsize: Maximum L1 entries (default: 10000)
+        cache_l1_ttl: L1 time-to-live in seconds; bounds cross-process staleness (default: 5.0)
+        http_cache_enabled: Cache GET responses per ETag/Cache-Control (default: False)
+        http_cache_maxsize: Maximum number of cached GET responses (default: 1024)
 
     Example:
         >>> config = SDKConfig(
@@ -57,10 +74,24 @@ class SDKConfig:
     retry_backoff: float = 0.5
     retry_multiplier: float = 2.0
     retry_on_status: set[int] = field(default_factory=lambda: {429, 500, 502, 503, 504})
+    retry_max_delay: float = 30.0
+    retry_jitter: float = 0.5
+    total_deadline: float | None = None
+    retry_methods: set[str] = field(
+        default_factory=lambda: {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    )
 
     # Connection pooling
     pool_maxsize: int = 10
     pool_connections: int = 10
+    keepalive_expiry: float = 30.0
+    share_connection_pool: bool = False
+
+    # HTTP protocol
+    http2: bool = True
+
+    # Request coalescing
+    coalesce_requests: bool = True
 
     # Validation
     validate_identifiers: bool = True
@@ -71,6 +102,13 @@ class SDKConfig:
     cache_redis_url: str | None = None
     cache_ttl: int = 300  # 5 minutes, same as service default
     cache_prefix: str = "perm_sdk"
+    cache_l1_enabled: bool = False
+    cache_l1_maxsize: int = 10_000
+    cache_l1_ttl: float = 5.0
+
+    # HTTP response cache for GET requests
+    http_cache_enabled: bool = False
+    http_cache_maxsize: int = 1024
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization.
@@ -120,6 +158,24 @@ class SDKConfig:
                 f"retry_multiplier must be >= 1, got: {self.retry_multiplier}",
             )
 
+        if self.retry_max_delay < 0:
+            raise ConfigurationError(
+                f"retry_max_delay must be non-negative, got: {self.retry_max_delay}"
+            )
+
+        if self.retry_jitter < 0:
+            raise ConfigurationError(
+                f"retry_jitter must be non-negative, got: {self.retry_jitter}"
+            )
+
+        if self.total_deadline is not None and self.total_deadline <= 0:
+            raise ConfigurationError(
+                f"total_deadline must be positive, got: {self.total_deadline}"
+            )
+
+        # Normalize method names so lookups are case-insensitive
+        self.retry_methods = {method.upper() for method in self.retry_methods}
+
         # Validate pool settings
         if self.pool_maxsize <= 0:
             raise ConfigurationError(f"pool_maxsize must be positive, got: {self.pool_maxsize}")
@@ -129,6 +185,11 @@ class SDKConfig:
                 f"pool_connections must be positive, got: {self.pool_connections}"
             )
 
+        if self.keepalive_expiry < 0:
+            raise ConfigurationError(
+                f"keepalive_expiry must be non-negative, got: {self.keepalive_expiry}"
+            )
+
         # Validate cache settings
         if self.cache_enabled:
             if self.cache_type not in ("redis", "memory", "none"):
@@ -142,6 +203,21 @@ class SDKConfig:
             if not self.cache_prefix:
                 raise ConfigurationError("cache_prefix cannot be empty")
 
+            if self.cache_l1_enabled and self.cache_l1_maxsize <= 0:
+                raise ConfigurationError(
+                    f"cache_l1_maxsize must be positive, got: {self.cache_l1_maxsize}"
+                )
+
+            if self.cache_l1_enabled and self.cache_l1_ttl <= 0:
+                raise ConfigurationError(
+                    f"cache_l1_ttl must be positive, got: {self.cache_l1_ttl}"
+                )
+
+        if self.http_cache_enabled and self.http_cache_maxsize <= 0:
+            raise ConfigurationError(
+                f"http_cache_maxsize must be positive, got: {self.http_cache_maxsize}"
+            )
+
     @classmethod
     def from_env(cls, prefix: str = "PERMISSION_SDK_") -> "SDKConfig":
         """Load configuration from environment variables.
@@ -153,14 +229,26 @@ class SDKConfig:
             {prefix}MAX_RETRIES: Maximum retry attempts (optional)
             {prefix}RETRY_BACKOFF: Initial retry backoff in seconds (optional)
             {prefix}RETRY_MULTIPLIER: Retry backoff multiplier (optional)
+            {prefix}RETRY_MAX_DELAY: Maximum retry backoff in seconds (optional)
+            {prefix}RETRY_JITTER: Retry backoff jitter fraction (optional)
+            {prefix}TOTAL_DEADLINE: Overall request deadline in seconds (optional)
             {prefix}POOL_MAXSIZE: Connection pool max size (optional)
             {prefix}POOL_CONNECTIONS: Number of connection pools (optional)
+            {prefix}KEEPALIVE_EXPIRY: Idle connection keep-alive in seconds (optional)
+            {prefix}SHARE_CONNECTION_POOL: Share the HTTP client process-wide (optional, true/false)
+            {prefix}HTTP2: Enable HTTP/2 (optional, true/false)
+            {prefix}COALESCE_REQUESTS: Coalesce identical concurrent reads (optional, true/false)
             {prefix}VALIDATE_IDENTIFIERS: Enable validation (optional, true/false)
             {prefix}CACHE_ENABLED: Enable SDK caching (optional, true/false)
             {prefix}CACHE_TYPE: Cache type - redis/memory/none (optional)
             {prefix}CACHE_REDIS_URL: Redis URL for cache (optional)
             {prefix}CACHE_TTL: Cache TTL in seconds (optional)
             {prefix}CACHE_PREFIX: Cache key prefix (optional)
+            {prefix}CACHE_L1_ENABLED: Enable in-process L1 cache (optional, true/false)
+            {prefix}CACHE_L1_MAXSIZE: Maximum L1 entries (optional)
+            {prefix}CACHE_L1_TTL: L1 TTL in seconds (optional)
+            {prefix}HTTP_CACHE_ENABLED: Enable GET response caching (optional, true/false)
+            {prefix}HTTP_CACHE_MAXSIZE: Maximum cached GET responses (optional)
 
         Args:
             prefix: Environment variable prefix (default: "PERMISSION_SDK_")
@@ -191,8 +279,18 @@ class SDKConfig:
         max_retries = int(os.getenv(f"{prefix}MAX_RETRIES", "3"))
         retry_backoff = float(os.getenv(f"{prefix}RETRY_BACKOFF", "0.5"))
         retry_multiplier = float(os.getenv(f"{prefix}RETRY_MULTIPLIER", "2.0"))
+        retry_max_delay = float(os.getenv(f"{prefix}RETRY_MAX_DELAY", "30.0"))
+        retry_jitter = float(os.getenv(f"{prefix}RETRY_JITTER", "0.5"))
+        total_deadline_env = os.getenv(f"{prefix}TOTAL_DEADLINE")
+        total_deadline = float(total_deadline_env) if total_deadline_env else None
         pool_maxsize = int(os.getenv(f"{prefix}POOL_MAXSIZE", "10"))
         pool_connections = int(os.getenv(f"{prefix}POOL_CONNECTIONS", "10"))
+        keepalive_expiry = float(os.getenv(f"{prefix}KEEPALIVE_EXPIRY", "30.0"))
+        share_connection_pool = (
+            os.getenv(f"{prefix}SHARE_CONNECTION_POOL", "false").lower() == "true"
+        )
+        http2 = os.getenv(f"{prefix}HTTP2", "true").lower() == "true"
+        coalesce_requests = os.getenv(f"{prefix}COALESCE_REQUESTS", "true").lower() == "true"
         validate_identifiers = (
             os.getenv(
                 f"{prefix}VALIDATE_IDENTIFIERS",
@@ -209,6 +307,15 @@ class SDKConfig:
         cache_redis_url = os.getenv(f"{prefix}CACHE_REDIS_URL")
         cache_ttl = int(os.getenv(f"{prefix}CACHE_TTL", "300"))
         cache_prefix = os.getenv(f"{prefix}CACHE_PREFIX", "perm_sdk")
+        cache_l1_enabled = (
+            os.getenv(f"{prefix}CACHE_L1_ENABLED", "false").lower() == "true"
+        )
+        cache_l1_maxsize = int(os.getenv(f"{prefix}CACHE_L1_MAXSIZE", "10000"))
+        cache_l1_ttl = float(os.getenv(f"{prefix}CACHE_L1_TTL", "5.0"))
+        http_cache_enabled = (
+            os.getenv(f"{prefix}HTTP_CACHE_ENABLED", "false").lower() == "true"
+        )
+        http_cache_maxsize = int(os.getenv(f"{prefix}HTTP_CACHE_MAXSIZE", "1024"))
 
         return cls(
             base_url=base_url,
@@ -217,14 +324,26 @@ class SDKConfig:
             max_retries=max_retries,
             retry_backoff=retry_backoff,
             retry_multiplier=retry_multiplier,
+            retry_max_delay=retry_max_delay,
+            retry_jitter=retry_jitter,
+            total_deadline=total_deadline,
             pool_maxsize=pool_maxsize,
             pool_connections=pool_connections,
+            keepalive_expiry=keepalive_expiry,
+            share_connection_pool=share_connection_pool,
+            http2=http2,
+            coalesce_requests=coalesce_requests,
             validate_identifiers=validate_identifiers,
             cache_enabled=cache_enabled,
             cache_type=cache_type,
             cache_redis_url=cache_redis_url,
             cache_ttl=cache_ttl,
             cache_prefix=cache_prefix,
+            cache_l1_enabled=cache_l1_enabled,
+            cache_l1_maxsize=cache_l1_maxsize,
+            cache_l1_ttl=cache_l1_ttl,
+            http_cache_enabled=http_cache_enabled,
+            http_cache_maxsize=http_cache_maxsize,
         )
 
     def copy(self, **changes: object) -> "SDKConfig":
@@ -248,14 +367,27 @@ class SDKConfig:
             "retry_backoff": self.retry_backoff,
             "retry_multiplier": self.retry_multiplier,
             "retry_on_status": self.retry_on_status.copy(),
+            "retry_max_delay": self.retry_max_delay,
+            "retry_jitter": self.retry_jitter,
+            "total_deadline": self.total_deadline,
+            "retry_methods": self.retry_methods.copy(),
             "pool_maxsize": self.pool_maxsize,
             "pool_connections": self.pool_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+            "share_connection_pool": self.share_connection_pool,
+            "http2": self.http2,
+            "coalesce_requests": self.coalesce_requests,
             "validate_identifiers": self.validate_identifiers,
             "cache_enabled": self.cache_enabled,
             "cache_type": self.cache_type,
             "cache_redis_url": self.cache_redis_url,
             "cache_ttl": self.cache_ttl,
             "cache_prefix": self.cache_prefix,
+            "cache_l1_enabled": self.cache_l1_enabled,
+            "cache_l1_maxsize": self.cache_l1_maxsize,
+            "cache_l1_ttl": self.cache_l1_ttl,
+            "http_cache_enabled": self.http_cache_enabled,
+            "http_cache_maxsize": self.http_cache_maxsize,
         }
         current.update(changes)
         return SDKConfig(**current)  # type: ignore
@@ -265,12 +265,12 @@ class TimeoutError(PermissionSDKError):
         ...     print(f"Request timed out after {e.timeout} seconds")
     """
 
-    def __init__(self, message: str, timeout: float) -> None:
+    def __init__(self, message: str, timeout: float | None = None) -> None:
         """Initialize timeout error.
 
         Args:
             message: Error message
-            timeout: Timeout value that was exceeded (in seconds)
+            timeout: Timeout value that was exceeded (in seconds), if known
         """
         super().__init__(message)
         self.timeout = timeout
@@ -3,6 +3,8 @@
 This package contains all Pydantic models used for request/response serialization.
 """
 
+from pydantic import BaseModel
+
 from permission_sdk.models.common import PaginatedResponse
 from permission_sdk.models.limits import (
     CheckAndIncrementManyRequest,
@@ -40,6 +42,33 @@ from permission_sdk.models.permissions import (
 from permission_sdk.models.scopes import Scope, ScopeFilter
 from permission_sdk.models.subjects import Subject, SubjectFilter
 
+# Parametrized paginated responses built by build_all_schemas(). Pydantic only
+# keeps weak references to generic parametrizations, so hold them here.
+_PAGINATED_MODELS: list[type[BaseModel]] = []
+
+
+def build_all_schemas() -> None:
+    """Build all model validators up front.
+
+    Plain models are completed at class creation, but generic parametrizations
+    such as ``PaginatedResponse[Subject]`` are built on first use. Building them
+    at import time moves that one-off cost out of the first list call.
+
+    Example:
+        >>> from permission_sdk.models import build_all_schemas
+        >>> build_all_schemas()
+    """
+    for name in __all__:
+        model = globals()[name]
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            if not model.__pydantic_complete__:
+                model.model_rebuild()
+
+    if not _PAGINATED_MODELS:
+        for item_model in (PermissionDetail, Subject, Scope, LimitDetail):
+            _PAGINATED_MODELS.append(PaginatedResponse[item_model])  # type: ignore[valid-type]
+
+
 __all__ = [
     # Common
     "PaginatedResponse",
@@ -80,4 +109,6 @@ __all__ = [
     "ResetUsageRequest",
     "ResetUsageResult",
     "LimitFilter",
+    # Schema building
+    "build_all_schemas",
 ]
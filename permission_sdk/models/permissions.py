@@ -98,8 +98,12 @@ class RevokeRequest(BaseModel):
 class CheckRequest(BaseModel):
     """Request to check if subject(s) have a permission.
 
+    Check requests are immutable and hashable, so identical checks can be
+    collapsed with a set or used as dictionary keys (e.g., to deduplicate
+    a batch before sending it to the API).
+
     Attributes:
-        subjects: List of subject identifiers to check (in priority order)
+        subjects: Subject identifiers to check (in priority order)
         scope: Scope identifier
         action: Permission action
         tenant_id: Optional tenant identifier
@@ -115,8 +119,10 @@ class CheckRequest(BaseModel):
         ... )
     """
 
-    subjects: list[str] = Field(
-        ..., min_length=1, max_length=100, description="List of subject identifiers"
+    model_config = {"frozen": True}
+
+    subjects: tuple[str, ...] = Field(
+        ..., min_length=1, max_length=100, description="Subject identifiers"
     )
     scope: str = Field(..., min_length=1, max_length=255, description="Scope identifier")
     action: str = Field(..., min_length=1, max_length=100, description="Permission action")
@@ -3,16 +3,61 @@
 This module contains helper functions for validation, formatting, and other utilities.
 """
 
+import json
+import math
 import re
+from collections.abc import Iterable, Iterator
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
 from permission_sdk.exceptions import ValidationError
 
-# Regular expressions for validation
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup (pip install permission-sdk[fast])
+    orjson = None  # type: ignore[assignment]
+
+# Regular expressions for validation (used with fullmatch, so no anchors)
 # Colon is optional - can be "type:id" or just "identifier"
-SUBJECT_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+(?::[a-zA-Z0-9_@.\-]+)?$")
-SCOPE_PATTERN = re.compile(r"^[a-z0-9_.:.-]+$")
-ACTION_PATTERN = re.compile(r"^[a-z0-9_-]+$")
+SUBJECT_PATTERN = re.compile(r"[a-zA-Z0-9_-]+(?::[a-zA-Z0-9_@.\-]+)?")
+SCOPE_PATTERN = re.compile(r"[a-z0-9_.:-]+")
+ACTION_PATTERN = re.compile(r"[a-z0-9_-]+")
+
+# Bound matcher avoids an attribute lookup on every validation
+_subject_fullmatch = SUBJECT_PATTERN.fullmatch
+
+# Scopes and actions are plain character classes; a set check runs in C
+# without entering the regex engine
+_SCOPE_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_.:-")
+_ACTION_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_-")
+
+# Length limits enforced by the API models, checked before running a regex
+MAX_SUBJECT_LENGTH = 255
+MAX_SCOPE_LENGTH = 255
+MAX_ACTION_LENGTH = 100
+
+
+# Identifiers repeat heavily across calls, so pattern checks are memoized.
+# Callers check the length limit first so oversized input never enters a cache.
+@lru_cache(maxsize=4096)
+def _is_valid_subject(identifier: str) -> bool:
+    """Check a subject identifier against SUBJECT_PATTERN."""
+    return len(identifier) >= 3 and _subject_fullmatch(identifier) is not None
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_scope(identifier: str) -> bool:
+    """Check a scope identifier against the SCOPE_PATTERN character set."""
+    return bool(identifier) and _SCOPE_CHARS.issuperset(identifier)
+
+
+@lru_cache(maxsize=1024)
+def _is_valid_action(action: str) -> bool:
+    """Check a permission action against the ACTION_PATTERN character set."""
+    return bool(action) and _ACTION_CHARS.issuperset(action)
 
 
 def validate_subject_identifier(identifier: str) -> None:
@@ -41,13 +86,22 @@ def validate_subject_identifier(identifier: str) -> None:
     if not identifier:
         raise ValidationError("Subject identifier cannot be empty", field="subject")
 
+    if len(identifier) <= MAX_SUBJECT_LENGTH and _is_valid_subject(identifier):
+        return
+
     if len(identifier) < 3:
         raise ValidationError(
             "Subject identifier must be at least 3 characters long",
             field="subject",
         )
 
-    if not SUBJECT_PATTERN.match(identifier):
+    if len(identifier) > MAX_SUBJECT_LENGTH:
+        raise ValidationError(
+            f"Subject identifier must be at most {MAX_SUBJECT_LENGTH} characters long",
+            field="subject",
+        )
+
+    if not SUBJECT_PATTERN.fullmatch(identifier):
         raise ValidationError(
             f"Invalid subject identifier format: '{identifier}'. "
             "Expected format: 'identifier' or 'type:id' (e.g., 'system', 'user:123', 'role:editor')",
@@ -79,7 +133,16 @@ def validate_scope_identifier(identifier: str) -> None:
     if not identifier:
         raise ValidationError("Scope identifier cannot be empty", field="scope")
 
-    if not SCOPE_PATTERN.match(identifier):
+    if len(identifier) <= MAX_SCOPE_LENGTH and _is_valid_scope(identifier):
+        return
+
+    if len(identifier) > MAX_SCOPE_LENGTH:
+        raise ValidationError(
+            f"Scope identifier must be at most {MAX_SCOPE_LENGTH} characters long",
+            field="scope",
+        )
+
+    if not SCOPE_PATTERN.fullmatch(identifier):
         raise ValidationError(
             f"Invalid scope identifier format: '{identifier}'. "
             "Scope must be lowercase and contain only letters, "
@@ -111,7 +174,16 @@ def validate_action(action: str) -> None:
     if not action:
         raise ValidationError("Action cannot be empty", field="action")
 
-    if not ACTION_PATTERN.match(action):
+    if len(action) <= MAX_ACTION_LENGTH and _is_valid_action(action):
+        return
+
+    if len(action) > MAX_ACTION_LENGTH:
+        raise ValidationError(
+            f"Action must be at most {MAX_ACTION_LENGTH} characters long",
+            field="action",
+        )
+
+    if not ACTION_PATTERN.fullmatch(action):
         raise ValidationError(
             f"Invalid action format: '{action}'. "
             "Action must be lowercase and contain only "
@@ -151,7 +223,8 @@ def validate_grant_request(
 def chunk_list(items: list[Any], chunk_size: int) -> list[list[Any]]:
     """Split a list into chunks of specified size.
 
-    This is useful for batch operations that have size limits.
+    This is useful for batch operations that have size limits. Use
+    iter_chunks() to avoid materializing every chunk up front.
 
     Args:
         items: List to chunk
@@ -168,6 +241,33 @@ def chunk_list(items: list[Any], chunk_size: int) -> list[list[Any]]:
     return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
 
 
+def iter_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[list[Any]]:
+    """Lazily split an iterable into chunks of specified size.
+
+    Unlike chunk_list(), only one chunk is held in memory at a time, and the
+    input can be any iterable (e.g., a generator reading from a file).
+
+    Args:
+        items: Iterable to chunk
+        chunk_size: Size of each chunk
+
+    Yields:
+        Lists of up to chunk_size items
+
+    Raises:
+        ValueError: If chunk_size is not positive
+
+    Example:
+        >>> for chunk in iter_chunks(range(7), 3):
+        ...     print(chunk)  # [0, 1, 2], then [3, 4, 5], then [6]
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
 def normalize_url(url: str) -> str:
     """Normalize URL by removing trailing slashes.
 
@@ -207,9 +307,85 @@ def parse_subject_identifier(identifier: str) -> tuple[str, str]:
     """
     validate_subject_identifier(identifier)
 
-    parts = identifier.split(":", 1)
-    if len(parts) == 1:
-        # Single-word identifier like "system", "admin", "guest"
-        return parts[0], parts[0]
+    # Single-word identifiers like "system" have no colon and map to (id, id)
+    subject_type, _, subject_id = identifier.partition(":")
+    return subject_type, subject_id or subject_type
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse an HTTP ``Retry-After`` header value.
+
+    The header may hold either a number of seconds or an HTTP-date.
+
+    Args:
+        value: Raw header value (or None if the header was absent)
+
+    Returns:
+        Seconds to wait (never negative), or None if missing or invalid
+
+    Example:
+        >>> parse_retry_after("120")
+        120.0
+        >>> parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT")  # In the past
+        0.0
+    """
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # Negative, infinite and NaN delays are invalid rather than "retry now"
+        return seconds if math.isfinite(seconds) and seconds >= 0 else None
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
 
-    return parts[0], parts[1]
+def json_dumps(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON.
+
+    Uses ``orjson`` when installed and falls back to the standard library.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded JSON document
+
+    Example:
+        >>> json_dumps({"allowed": True})
+        b'{"allowed":true}'
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Uses ``orjson`` when installed and falls back to the standard library.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        Decoded data
+
+    Example:
+        >>> json_loads(b'{"allowed":true}')
+        {'allowed': True}
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -3,24 +3,28 @@
 This module provides common fixtures and configuration for all tests.
 """
 
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import pytest
-import requests_mock
-import respx
 
-from permission_sdk import (
-    AsyncPermissionClient,
-    PermissionClient,
-    SDKConfig,
-)
+from permission_sdk import SDKConfig
 from permission_sdk.models import (
     PermissionAssignment,
     PermissionDetail,
     Subject,
 )
 
+# Mock libraries and clients are imported inside the fixtures that use them,
+# so sessions that never request those fixtures do not pay for the imports
+if TYPE_CHECKING:
+    import requests_mock
+    import respx
+
+    from permission_sdk import AsyncPermissionClient, PermissionClient
+
 
 # ==================== Configuration Fixtures ====================
 
@@ -60,7 +64,7 @@ def sdk_config_no_validation() -> SDKConfig:
 
 
 @pytest.fixture
-def sync_client(sdk_config: SDKConfig) -> PermissionClient:
+def sync_client(sdk_config: SDKConfig) -> "PermissionClient":
     """Create a synchronous Permission client.
 
     Args:
@@ -69,11 +73,13 @@ def sync_client(sdk_config: SDKConfig) -> PermissionClient:
     Returns:
         PermissionClient instance
     """
+    from permission_sdk import PermissionClient
+
     return PermissionClient(sdk_config)
 
 
 @pytest.fixture
-async def async_client(sdk_config: SDKConfig) -> AsyncPermissionClient:
+async def async_client(sdk_config: SDKConfig) -> "AsyncPermissionClient":
     """Create an asynchronous Permission client.
 
     Args:
@@ -82,6 +88,8 @@ async def async_client(sdk_config: SDKConfig) -> AsyncPermissionClient:
     Returns:
         AsyncPermissionClient instance
     """
+    from permission_sdk import AsyncPermissionClient
+
     client = AsyncPermissionClient(sdk_config)
     yield client
     await client.close()
@@ -91,7 +99,7 @@ async def async_client(sdk_config: SDKConfig) -> AsyncPermissionClient:
 
 
 @pytest.fixture
-def mock_requests() -> requests_mock.Mocker:
+def mock_requests() -> "requests_mock.Mocker":
     """Create requests mock for testing sync client.
 
     Returns:
@@ -104,12 +112,14 @@ def mock_requests() -> requests_mock.Mocker:
         ...         json={"assignment_id": "123", ...}
         ...     )
     """
+    import requests_mock
+
     with requests_mock.Mocker() as m:
         yield m
 
 
 @pytest.fixture
-def mock_httpx() -> respx.MockRouter:
+def mock_httpx() -> "respx.MockRouter":
     """Create httpx mock for testing async client.
 
     Returns:
@@ -121,12 +131,19 @@ def mock_httpx() -> respx.MockRouter:
         ...         "http://test-api.example.com/api/v1/permissions/grant"
         ...     ).mock(return_value=httpx.Response(200, json={...}))
     """
+    import respx
+
     with respx.mock:
         yield respx
 
 
 # ==================== Sample Data Fixtures ====================
 
+# Tests only need a plausible timestamp; a fixed one keeps sample data
+# deterministic. The fixtures stay function-scoped so each test gets its own
+# mutable dict.
+_FIXED_ISO = datetime(2024, 1, 1, 12, 0, 0).isoformat()
+
 
 @pytest.fixture
 def sample_permission_assignment() -> dict[str, Any]:
@@ -142,7 +159,7 @@ def sample_permission_assignment() -> dict[str, Any]:
         "action": "read",
         "tenant_id": "org:acme",
         "object_id": None,
-        "granted_at": datetime.now().isoformat(),
+        "granted_at": _FIXED_ISO,
         "expires_at": None,
         "metadata": {"granted_by": "admin:1"},
     }
@@ -165,7 +182,7 @@ def sample_permission_detail() -> dict[str, Any]:
         "action": "read",
         "tenant_id": "org:acme",
         "object_id": None,
-        "granted_at": datetime.now().isoformat(),
+        "granted_at": _FIXED_ISO,
         "expires_at": None,
         "is_valid": True,
         "metadata": None,
@@ -187,8 +204,8 @@ def sample_subject() -> dict[str, Any]:
         "display_name": "Alice Smith",
         "tenant_id": "org:acme",
         "metadata": {"email": "alice@acme.com"},
-        "created_at": datetime.now().isoformat(),
-        "updated_at": datetime.now().isoformat(),
+        "created_at": _FIXED_ISO,
+        "updated_at": _FIXED_ISO,
     }
 
 
@@ -205,66 +222,81 @@ def sample_scope() -> dict[str, Any]:
         "display_name": "Document Management",
         "description": "Permissions for managing documents",
         "metadata": {"category": "content"},
-        "created_at": datetime.now().isoformat(),
-        "updated_at": datetime.now().isoformat(),
+        "created_at": _FIXED_ISO,
+        "updated_at": _FIXED_ISO,
     }
 
 
 # ==================== Error Response Fixtures ====================
 
+# Error bodies are read-only, so the fixtures hand out shared immutable views.
+# Tests that need to modify one can take a copy with dict(...).
+_ERROR_401 = MappingProxyType(
+    {
+        "detail": "Invalid API key",
+        "error_type": "AuthenticationError",
+    }
+)
+_ERROR_400 = MappingProxyType(
+    {
+        "detail": "Invalid subject identifier format",
+        "error_type": "ValidationError",
+        "field": "subject",
+    }
+)
+_ERROR_404 = MappingProxyType(
+    {
+        "detail": "Subject not found",
+        "error_type": "ResourceNotFoundError",
+        "resource_type": "Subject",
+    }
+)
+_ERROR_429 = MappingProxyType(
+    {
+        "detail": "Rate limit exceeded",
+        "error_type": "RateLimitError",
+    }
+)
 
-@pytest.fixture
-def error_response_401() -> dict[str, Any]:
+
+@pytest.fixture(scope="session")
+def error_response_401() -> Mapping[str, Any]:
     """Create sample 401 error response.
 
     Returns:
-        Dictionary representing an authentication error
+        Read-only mapping representing an authentication error
     """
-    return {
-        "detail": "Invalid API key",
-        "error_type": "AuthenticationError",
-    }
+    return _ERROR_401
 
 
-@pytest.fixture
-def error_response_400() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def error_response_400() -> Mapping[str, Any]:
     """Create sample 400 error response.
 
     Returns:
-        Dictionary representing a validation error
+        Read-only mapping representing a validation error
     """
-    return {
-        "detail": "Invalid subject identifier format",
-        "error_type": "ValidationError",
-        "field": "subject",
-    }
+    return _ERROR_400
 
 
-@pytest.fixture
-def error_response_404() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def error_response_404() -> Mapping[str, Any]:
     """Create sample 404 error response.
 
     Returns:
-        Dictionary representing a not found error
+        Read-only mapping representing a not found error
     """
-    return {
-        "detail": "Subject not found",
-        "error_type": "ResourceNotFoundError",
-        "resource_type": "Subject",
-    }
+    return _ERROR_404
 
 
-@pytest.fixture
-def error_response_429() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def error_response_429() -> Mapping[str, Any]:
     """Create sample 429 error response.
 
     Returns:
-        Dictionary representing a rate limit error
+        Read-only mapping representing a rate limit error
     """
-    return {
-        "detail": "Rate limit exceeded",
-        "error_type": "RateLimitError",
-    }
+    return _ERROR_429
 
 
 # ==================== Pytest Configuration ====================
@@ -1,7 +1,9 @@
 """Unit tests for SDK cache implementations."""
 
+import httpx
 import pytest
 
+from permission_sdk.cache.http_cache import HTTPResponseCache
 from permission_sdk.cache.memory import InMemoryCacheService
 from permission_sdk.cache.noop import NoOpCacheService
 from permission_sdk.cache.permission_cache import PermissionCacheManager
@@ -63,17 +65,19 @@ class TestInMemoryCacheService:
         assert await cache.get("perm:check:role:admin") is True
 
     @pytest.mark.asyncio
-    async def test_ttl_expiration(self):
+    async def test_ttl_expiration(self, monkeypatch):
         """Test TTL expiration."""
-        import asyncio
+        now = 1000.0
+        monkeypatch.setattr("permission_sdk.cache.memory.time.time", lambda: now)
 
         cache = InMemoryCacheService()
 
-        # Set value with 0.1 second TTL
-        await cache.set("test_key", "test_value", ttl=0)
+        # Set value with 10 second TTL
+        await cache.set("test_key", "test_value", ttl=10)
+        assert await cache.get("test_key") == "test_value"
 
-        # Wait for expiration
-        await asyncio.sleep(0.1)
+        # Advance the clock past expiration instead of sleeping
+        now += 20
 
         # Value should be expired
         value = await cache.get("test_key")
@@ -136,12 +140,8 @@ class TestPermissionCacheManager:
         manager = PermissionCacheManager(cache)
 
         # Different order, same subjects
-        key1 = manager._build_check_key(
-            ["user:123", "role:editor"], "docs", "read", "tenant1", None
-        )
-        key2 = manager._build_check_key(
-            ["role:editor", "user:123"], "docs", "read", "tenant1", None
-        )
+        key1 = manager.build_check_key(["user:123", "role:editor"], "docs", "read", "tenant1", None)
+        key2 = manager.build_check_key(["role:editor", "user:123"], "docs", "read", "tenant1", None)
 
         # Keys should be identical
         assert key1 == key2
@@ -171,15 +171,9 @@ class TestPermissionCacheManager:
         manager = PermissionCacheManager(cache)
 
         # Cache multiple results for user:123
-        await manager.set_check_result(
-            ["user:123"], "docs", "read", True, None, None, 300
-        )
-        await manager.set_check_result(
-            ["user:123"], "docs", "write", False, None, None, 300
-        )
-        await manager.set_check_result(
-            ["user:456"], "docs", "read", True, None, None, 300
-        )
+        await manager.set_check_result(["user:123"], "docs", "read", True, None, None, 300)
+        await manager.set_check_result(["user:123"], "docs", "write", False, None, None, 300)
+        await manager.set_check_result(["user:456"], "docs", "read", True, None, None, 300)
 
         # Invalidate user:123
         deleted = await manager.invalidate_subject("user:123")
@@ -213,3 +207,188 @@ class TestPermissionCacheManager:
 
         # But user:789 remains
         assert await manager.get_check_result(["user:789"], "docs", "read") is True
+
+    @pytest.mark.asyncio
+    async def test_bump_revisions(self):
+        """Test that bumping a subject's revision invalidates its cached checks."""
+        cache = InMemoryCacheService()
+        manager = PermissionCacheManager(cache)
+
+        await manager.set_check_result(["user:123"], "docs", "read", True, None, None, 300)
+        await manager.set_check_result(
+            ["user:123", "role:admin"], "docs", "write", True, None, None, 300
+        )
+        await manager.set_check_result(["user:456"], "docs", "read", True, None, None, 300)
+
+        assert await manager.bump_revisions(["user:123"]) == [1]
+
+        assert await manager.get_check_result(["user:123"], "docs", "read") is None
+        assert await manager.get_check_result(["role:admin", "user:123"], "docs", "write") is None
+        assert await manager.get_check_result(["user:456"], "docs", "read") is True
+
+        # Results cached after the bump are valid again
+        await manager.set_check_result(["user:123"], "docs", "read", False, None, None, 300)
+        assert await manager.get_check_result(["user:123"], "docs", "read") is False
+
+    @pytest.mark.asyncio
+    async def test_bumped_revision_outlives_cached_entries(self, monkeypatch):
+        """Test that a bump still invalidates entries cached without a TTL much later."""
+        now = 1000.0
+        monkeypatch.setattr("permission_sdk.cache.memory.time.time", lambda: now)
+
+        cache = InMemoryCacheService()
+        manager = PermissionCacheManager(cache)
+
+        await manager.set_check_result(["user:1"], "docs", "read", True, None, None, None)
+        await manager.bump_revisions(["user:1"])
+        assert await manager.get_check_result(["user:1"], "docs", "read") is None
+
+        # A revoked result must not come back once time passes
+        now += 86401
+        assert await manager.get_check_result(["user:1"], "docs", "read") is None
+
+    @pytest.mark.asyncio
+    async def test_bump_during_api_call_invalidates_result(self):
+        """Test that a result stored under the lookup's revisions is stale after a bump."""
+        cache = InMemoryCacheService()
+        manager = PermissionCacheManager(cache, l1_maxsize=10)
+        key = manager.build_check_key(["user:1"], "docs", "read")
+
+        cached, revisions = await manager.get_check_result_by_key(key, ["user:1"])
+        assert cached is None
+
+        # A revoke lands while the API call for the check is in flight
+        await manager.bump_revisions(["user:1"])
+        await manager.set_check_result_by_key(key, ["user:1"], True, ttl=300, revisions=revisions)
+
+        assert await manager.get_check_result(["user:1"], "docs", "read") is None
+
+    @pytest.mark.asyncio
+    async def test_bump_during_batch_api_call_invalidates_results(self):
+        """Test that batch results stored under stale revisions are not served."""
+        cache = InMemoryCacheService()
+        manager = PermissionCacheManager(cache, l1_maxsize=10)
+        checks = [
+            {"subjects": ["user:1"], "scope": "docs", "action": "read"},
+            {"subjects": ["user:2"], "scope": "docs", "action": "read"},
+        ]
+
+        cached, revisions = await manager.get_check_results_many(checks)
+        assert cached == [None, None]
+
+        await manager.bump_revisions(["user:1"])
+        await manager.set_check_results_many(checks, [True, True], ttl=300, revisions=revisions)
+
+        assert await manager.get_check_results_many(checks) == (
+            [None, True],
+            {"user:1": 1, "user:2": 0},
+        )
+
+    @pytest.mark.asyncio
+    async def test_check_results_many_share_single_entries(self):
+        """Test that batch lookups reuse single-check entries and report misses."""
+        cache = InMemoryCacheService()
+        manager = PermissionCacheManager(cache)
+        checks = [
+            {"subjects": ["user:123"], "scope": "docs", "action": "read"},
+            {"subjects": ["user:123"], "scope": "docs", "action": "write"},
+        ]
+
+        await manager.set_check_result(["user:123"], "docs", "read", True, None, None, 300)
+        assert await manager.get_check_results_many(checks) == ([True, None], {"user:123": 0})
+
+        await manager.set_check_results_many(checks[1:], [False], ttl=300)
+        assert await manager.get_check_result(["user:123"], "docs", "write") is False
+        assert await manager.get_check_results_many(checks) == ([True, False], {"user:123": 0})
+
+    @pytest.mark.asyncio
+    async def test_l1_serves_without_backend(self):
+        """Test that the L1 layer answers checks without hitting the backend."""
+        cache = InMemoryCacheService()
+        manager = PermissionCacheManager(cache, l1_maxsize=10)
+
+        await manager.set_check_result(["user:123"], "docs", "read", True, None, None, 300)
+        await cache.clear()
+
+        assert await manager.get_check_result(["user:123"], "docs", "read") is True
+
+    @pytest.mark.asyncio
+    async def test_l1_invalidated_with_subject(self):
+        """Test that invalidating a subject also drops its L1 entries."""
+        cache = InMemoryCacheService()
+        manager = PermissionCacheManager(cache, l1_maxsize=10)
+
+        await manager.set_check_result(["user:123"], "docs", "read", True, None, None, 300)
+        await manager.invalidate_subject("user:123")
+
+        assert await manager.get_check_result(["user:123"], "docs", "read") is None
+
+
+class TestHTTPResponseCache:
+    """Tests for the GET response cache."""
+
+    def test_key_ignores_param_order(self):
+        """Test that query parameter order does not affect the key."""
+        key_a = HTTPResponseCache.make_key("/api/v1/subjects", {"a": 1, "b": 2})
+        key_b = HTTPResponseCache.make_key("/api/v1/subjects", {"b": 2, "a": 1})
+        assert key_a == key_b
+
+    def test_store_fresh_response(self):
+        """Test that a response with max-age is served fresh."""
+        cache = HTTPResponseCache()
+        key = cache.make_key("/api/v1/subjects", None)
+        response = httpx.Response(200, headers={"Cache-Control": "max-age=60"})
+
+        cache.store(key, {"items": []}, response)
+
+        entry = cache.get(key)
+        assert entry is not None
+        assert entry.is_fresh
+        assert entry.body == {"items": []}
+
+    def test_store_etag_only_is_stale(self):
+        """Test that an ETag-only response is cached for revalidation."""
+        cache = HTTPResponseCache()
+        key = cache.make_key("/api/v1/subjects", None)
+        response = httpx.Response(200, headers={"ETag": '"v1"'})
+
+        cache.store(key, {"items": []}, response)
+
+        entry = cache.get(key)
+        assert entry is not None
+        assert not entry.is_fresh
+        assert entry.etag == '"v1"'
+
+    def test_no_store_is_not_cached(self):
+        """Test that no-store responses are not cached."""
+        cache = HTTPResponseCache()
+        key = cache.make_key("/api/v1/subjects", None)
+        response = httpx.Response(200, headers={"Cache-Control": "no-store", "ETag": '"v1"'})
+
+        cache.store(key, {"items": []}, response)
+
+        assert cache.get(key) is None
+
+    def test_refresh_extends_expiry(self):
+        """Test that a 304 response makes a stale entry fresh again."""
+        cache = HTTPResponseCache()
+        key = cache.make_key("/api/v1/subjects", None)
+        cache.store(key, {"items": []}, httpx.Response(200, headers={"ETag": '"v1"'}))
+
+        cache.refresh(key, httpx.Response(304, headers={"Cache-Control": "max-age=60"}))
+
+        entry = cache.get(key)
+        assert entry is not None
+        assert entry.is_fresh
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest entry is evicted when full."""
+        cache = HTTPResponseCache(maxsize=2)
+        response = httpx.Response(200, headers={"Cache-Control": "max-age=60"})
+        keys = [cache.make_key(f"/api/v1/subjects/{i}", None) for i in range(3)]
+
+        for key in keys:
+            cache.store(key, {}, response)
+
+        assert len(cache) == 2
+        assert cache.get(keys[0]) is None
@@ -0,0 +1,136 @@
+"""Unit tests for the Permission clients.
+
+HTTP traffic is mocked with respx, so requests run through the real transports.
+"""
+
+import json
+
+import httpx
+import pytest
+import respx
+
+from permission_sdk import AsyncPermissionClient, CheckRequest, PermissionClient, SDKConfig
+from permission_sdk.exceptions import PermissionSDKError, ServerError
+
+BASE_URL = "http://test-api.example.com"
+REVOKE_URL = f"{BASE_URL}/api/v1/permissions/revoke"
+REVOKE_MANY_URL = f"{BASE_URL}/api/v1/permissions/revoke-many"
+CHECK_MANY_URL = f"{BASE_URL}/api/v1/permissions/check-many"
+
+
+def _config() -> SDKConfig:
+    """Build a config that retries immediately."""
+    return SDKConfig(base_url=BASE_URL, api_key="test-api-key", retry_backoff=0)
+
+
+class TestIdempotencyKey:
+    """Tests for retrying writes that carry an idempotency key."""
+
+    @respx.mock
+    def test_write_without_key_is_not_retried(self) -> None:
+        """Test that a write that may have been applied is not resent."""
+        route = respx.post(REVOKE_URL).mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={"revoked": True})]
+        )
+
+        with PermissionClient(_config()) as client:
+            with pytest.raises(ServerError):
+                client.revoke_permission("user:alice", "docs", "read")
+
+        assert route.call_count == 1
+        assert "Idempotency-Key" not in route.calls.last.request.headers
+
+    @respx.mock
+    def test_write_with_key_is_retried(self) -> None:
+        """Test that a keyed write is resent with the same key after a 503."""
+        route = respx.post(REVOKE_URL).mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={"revoked": True})]
+        )
+
+        with PermissionClient(_config()) as client:
+            revoked = client.revoke_permission(
+                "user:alice", "docs", "read", idempotency_key="revoke-alice-1"
+            )
+
+        assert revoked is True
+        assert route.call_count == 2
+        assert [c.request.headers["Idempotency-Key"] for c in route.calls] == [
+            "revoke-alice-1",
+            "revoke-alice-1",
+        ]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_write_without_key_is_not_retried(self) -> None:
+        """Test that the async client does not resend an unkeyed write."""
+        route = respx.post(REVOKE_MANY_URL).mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={"revoked_count": 1})]
+        )
+
+        async with AsyncPermissionClient(_config()) as client:
+            with pytest.raises(ServerError):
+                await client.revoke_many([])
+
+        assert route.call_count == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_write_with_key_is_retried(self) -> None:
+        """Test that the async client resends a keyed write after a 503."""
+        route = respx.post(REVOKE_MANY_URL).mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={"revoked_count": 1})]
+        )
+
+        async with AsyncPermissionClient(_config()) as client:
+            count = await client.revoke_many([], idempotency_key="revoke-batch-1")
+
+        assert count == 1
+        assert route.call_count == 2
+        assert route.calls.last.request.headers["Idempotency-Key"] == "revoke-batch-1"
+
+
+class TestCheckMany:
+    """Tests for batch checks and their result fan-out."""
+
+    READ = CheckRequest(subjects=["user:alice"], scope="docs", action="read")
+    WRITE = CheckRequest(subjects=["user:alice"], scope="docs", action="write")
+
+    @respx.mock
+    def test_duplicates_are_sent_once_and_fanned_out(self) -> None:
+        """Test that identical checks share one result in every position."""
+        route = respx.post(CHECK_MANY_URL).mock(
+            return_value=httpx.Response(
+                200, json={"results": [{"allowed": True}, {"allowed": False}]}
+            )
+        )
+
+        with PermissionClient(_config()) as client:
+            results = client.check_many([self.READ, self.WRITE, self.READ])
+
+        assert [r.allowed for r in results] == [True, False, True]
+        assert len(json.loads(route.calls.last.request.content)["checks"]) == 2
+
+    @pytest.mark.parametrize("duplicate", [False, True])
+    @respx.mock
+    def test_result_count_mismatch_raises_sdk_error(self, duplicate: bool) -> None:
+        """Test that a short response fails the same way with or without duplicates."""
+        respx.post(CHECK_MANY_URL).mock(
+            return_value=httpx.Response(200, json={"results": [{"allowed": True}]})
+        )
+        checks = [self.READ, self.WRITE] + ([self.READ] if duplicate else [])
+
+        with PermissionClient(_config()) as client:
+            with pytest.raises(PermissionSDKError, match="returned 1 results for 2 checks"):
+                client.check_many(checks)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_result_count_mismatch_raises_sdk_error(self) -> None:
+        """Test that the async client also rejects a mismatched result count."""
+        respx.post(CHECK_MANY_URL).mock(
+            return_value=httpx.Response(200, json={"results": [{"allowed": True}]})
+        )
+
+        async with AsyncPermissionClient(_config()) as client:
+            with pytest.raises(PermissionSDKError, match="returned 1 results for 2 checks"):
+                await client.check_many([self.READ, self.WRITE, self.READ])
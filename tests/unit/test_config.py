@@ -23,6 +23,8 @@ class TestSDKConfig:
         assert config.api_key == "test-key"
         assert config.timeout == 30  # Default value
         assert config.max_retries == 3  # Default value
+        assert config.http2 is True  # Default value
+        assert config.coalesce_requests is True  # Default value
 
     def test_config_removes_trailing_slash(self) -> None:
         """Test that trailing slashes are removed from base_url."""
@@ -84,12 +86,56 @@ class TestSDKConfig:
                 retry_multiplier=0.5,
             )
 
+    def test_negative_retry_max_delay(self) -> None:
+        """Test that negative retry_max_delay raises ConfigurationError."""
+        with pytest.raises(ConfigurationError, match="retry_max_delay must be non-negative"):
+            SDKConfig(
+                base_url="https://api.example.com",
+                api_key="test-key",
+                retry_max_delay=-1,
+            )
+
+    def test_negative_retry_jitter(self) -> None:
+        """Test that negative retry_jitter raises ConfigurationError."""
+        with pytest.raises(ConfigurationError, match="retry_jitter must be non-negative"):
+            SDKConfig(
+                base_url="https://api.example.com",
+                api_key="test-key",
+                retry_jitter=-0.1,
+            )
+
+    def test_invalid_total_deadline(self) -> None:
+        """Test that a non-positive total_deadline raises ConfigurationError."""
+        with pytest.raises(ConfigurationError, match="total_deadline must be positive"):
+            SDKConfig(
+                base_url="https://api.example.com",
+                api_key="test-key",
+                total_deadline=0,
+            )
+
+    def test_retry_methods_normalized(self) -> None:
+        """Test that retry_methods are upper-cased."""
+        config = SDKConfig(
+            base_url="https://api.example.com",
+            api_key="test-key",
+            retry_methods={"get", "Put"},
+        )
+
+        assert config.retry_methods == {"GET", "PUT"}
+
+    def test_retry_methods_default_includes_idempotent_methods(self) -> None:
+        """Test that PUT and DELETE are retried by default, like the safe methods."""
+        config = SDKConfig(base_url="https://api.example.com", api_key="test-key")
+
+        assert config.retry_methods == {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
     def test_config_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test loading configuration from environment variables."""
         monkeypatch.setenv("PERMISSION_SDK_BASE_URL", "https://api.example.com")
         monkeypatch.setenv("PERMISSION_SDK_API_KEY", "env-key")
         monkeypatch.setenv("PERMISSION_SDK_TIMEOUT", "60")
         monkeypatch.setenv("PERMISSION_SDK_MAX_RETRIES", "5")
+        monkeypatch.setenv("PERMISSION_SDK_HTTP2", "false")
 
         config = SDKConfig.from_env()
 
@@ -97,6 +143,7 @@ class TestSDKConfig:
         assert config.api_key == "env-key"
         assert config.timeout == 60
         assert config.max_retries == 5
+        assert config.http2 is False
 
     def test_config_from_env_missing_required(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that missing required env vars raises ConfigurationError."""
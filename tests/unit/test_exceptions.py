@@ -3,6 +3,8 @@
 This module tests the custom exception classes.
 """
 
+import pytest
+
 from permission_sdk.exceptions import (
     AuthenticationError,
     ConfigurationError,
@@ -15,13 +17,15 @@ from permission_sdk.exceptions import (
     ValidationError,
 )
 
+pytestmark = [pytest.mark.unit, pytest.mark.filterwarnings("error")]
+
 
 class TestExceptionHierarchy:
     """Tests for exception class hierarchy."""
 
-    def test_all_exceptions_inherit_from_base(self) -> None:
-        """Test that all exceptions inherit from PermissionSDKError."""
-        exceptions = [
+    @pytest.mark.parametrize(
+        "exc_class",
+        [
             ConfigurationError,
             AuthenticationError,
             ValidationError,
@@ -30,11 +34,12 @@ class TestExceptionHierarchy:
             NetworkError,
             RateLimitError,
             TimeoutError,
-        ]
-
-        for exc_class in exceptions:
-            assert issubclass(exc_class, PermissionSDKError)
-            assert issubclass(exc_class, Exception)
+        ],
+    )
+    def test_inherits_from_base(self, exc_class: type[Exception]) -> None:
+        """Test that each exception inherits from PermissionSDKError."""
+        assert issubclass(exc_class, PermissionSDKError)
+        assert issubclass(exc_class, Exception)
 
 
 class TestValidationError:
@@ -0,0 +1,693 @@
+"""Unit tests for the SDK HTTP transports.
+
+HTTP traffic is mocked with respx so the retry, caching and error-mapping
+logic of both transports runs against canned responses.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Any
+
+import httpcore
+import httpx
+import pytest
+import respx
+
+from permission_sdk import SDKConfig
+from permission_sdk.async_transport import AsyncHTTPTransport
+from permission_sdk.exceptions import (
+    RateLimitError,
+    ResourceNotFoundError,
+    ServerError,
+    TimeoutError,
+)
+from permission_sdk.transport import HTTPTransport
+
+BASE_URL = "http://test-api.example.com"
+CHECK_MANY_URL = f"{BASE_URL}/api/v1/permissions/check-many"
+SUBJECTS_URL = f"{BASE_URL}/api/v1/subjects"
+
+
+def _config(**changes: object) -> SDKConfig:
+    """Build a plain config with optional overrides."""
+    config = SDKConfig(base_url=BASE_URL, api_key="test-api-key")
+    return config.copy(**changes) if changes else config
+
+
+def _cached_config() -> SDKConfig:
+    """Build a config with the in-memory permission cache enabled."""
+    return SDKConfig(
+        base_url=BASE_URL,
+        api_key="test-api-key",
+        cache_enabled=True,
+        cache_type="memory",
+    )
+
+
+def _check(subject: str, check_id: str) -> dict[str, object]:
+    """Build one item of a check-many request body."""
+    return {"subjects": [subject], "scope": "docs", "action": "read", "check_id": check_id}
+
+
+def _answer_checks(request: httpx.Request) -> httpx.Response:
+    """Allow every check except those for user:bob, echoing check IDs."""
+    checks = json.loads(request.content)["checks"]
+    return httpx.Response(
+        200,
+        json={
+            "results": [
+                {"allowed": c["subjects"] != ["user:bob"], "check_id": c["check_id"]}
+                for c in checks
+            ]
+        },
+    )
+
+
+class TestCheckManyCaching:
+    """Tests for batch checks served partly from the permission cache."""
+
+    @respx.mock
+    def test_sync_partial_miss_merges_in_order(self) -> None:
+        """Test that only misses are sent and results keep the request order."""
+        route = respx.post(CHECK_MANY_URL).mock(side_effect=_answer_checks)
+
+        with HTTPTransport(_cached_config()) as transport:
+            transport.request(
+                "POST",
+                "/api/v1/permissions/check-many",
+                json={"checks": [_check("user:alice", "a")]},
+            )
+
+            result = transport.request(
+                "POST",
+                "/api/v1/permissions/check-many",
+                json={"checks": [_check("user:alice", "a"), _check("user:bob", "b")]},
+            )
+
+        sent = json.loads(route.calls.last.request.content)["checks"]
+        assert [c["check_id"] for c in sent] == ["b"]
+        assert result["results"] == [
+            {"allowed": True, "check_id": "a"},
+            {"allowed": False, "check_id": "b"},
+        ]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_partial_miss_merges_in_order(self) -> None:
+        """Test that the async transport also sends only misses, in order."""
+        route = respx.post(CHECK_MANY_URL).mock(side_effect=_answer_checks)
+
+        async with AsyncHTTPTransport(_cached_config()) as transport:
+            await transport.request(
+                "POST",
+                "/api/v1/permissions/check-many",
+                json={"checks": [_check("user:bob", "b")]},
+            )
+
+            result = await transport.request(
+                "POST",
+                "/api/v1/permissions/check-many",
+                json={"checks": [_check("user:alice", "a"), _check("user:bob", "b")]},
+            )
+
+        sent = json.loads(route.calls.last.request.content)["checks"]
+        assert [c["check_id"] for c in sent] == ["a"]
+        assert result["results"] == [
+            {"allowed": True, "check_id": "a"},
+            {"allowed": False, "check_id": "b"},
+        ]
+
+
+class TestRequestCoalescing:
+    """Tests for sharing one round trip between identical concurrent reads."""
+
+    @staticmethod
+    def _run_concurrently(
+        transport: HTTPTransport, entered: threading.Event
+    ) -> tuple[list[Any], list[threading.Thread]]:
+        """Issue three identical GETs, starting followers once the leader is in flight."""
+        outcomes: list[Any] = []
+
+        def fetch() -> None:
+            try:
+                outcomes.append(transport.request("GET", "/api/v1/subjects"))
+            except Exception as e:
+                outcomes.append(e)
+
+        threads = [threading.Thread(target=fetch) for _ in range(3)]
+        threads[0].start()
+        assert entered.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        return outcomes, threads
+
+    @respx.mock
+    def test_sync_waiters_get_their_own_result(self) -> None:
+        """Test that waiters share one request but not one mutable result."""
+        entered, release = threading.Event(), threading.Event()
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            entered.set()
+            release.wait(5)
+            return httpx.Response(200, json={"items": [1]})
+
+        route = respx.get(SUBJECTS_URL).mock(side_effect=respond)
+
+        with HTTPTransport(_config()) as transport:
+            outcomes, threads = self._run_concurrently(transport, entered)
+            time.sleep(0.2)  # let the followers join the in-flight request
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        assert route.call_count == 1
+        assert len(outcomes) == 3
+        outcomes[0]["items"].append(2)
+        assert [o["items"] for o in outcomes[1:]] == [[1], [1]]
+
+    @respx.mock
+    def test_sync_waiters_raise_their_own_error(self) -> None:
+        """Test that each waiter raises a separate exception chained to the original."""
+        entered, release = threading.Event(), threading.Event()
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            entered.set()
+            release.wait(5)
+            return httpx.Response(404, json={"detail": "Subject not found"})
+
+        respx.get(SUBJECTS_URL).mock(side_effect=respond)
+
+        with HTTPTransport(_config()) as transport:
+            outcomes, threads = self._run_concurrently(transport, entered)
+            time.sleep(0.2)
+            release.set()
+            for thread in threads:
+                thread.join(5)
+
+        assert all(isinstance(o, ResourceNotFoundError) for o in outcomes)
+        assert len({id(o) for o in outcomes}) == 3
+        leaders = [o for o in outcomes if o.__cause__ is None]
+        assert len(leaders) == 1
+        assert all(o.__cause__ is leaders[0] for o in outcomes if o is not leaders[0])
+        assert all(str(o) == "Subject not found" for o in outcomes)
+
+    @respx.mock
+    def test_sync_coalescing_can_be_disabled(self) -> None:
+        """Test that coalesce_requests=False sends every identical read."""
+        both_in_flight = threading.Barrier(2, timeout=5)
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            both_in_flight.wait()
+            return httpx.Response(200, json={"items": []})
+
+        route = respx.get(SUBJECTS_URL).mock(side_effect=respond)
+
+        with HTTPTransport(_config(coalesce_requests=False)) as transport:
+            threads = [
+                threading.Thread(target=transport.request, args=("GET", "/api/v1/subjects"))
+                for _ in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+
+        assert route.call_count == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_waiters_get_their_own_result(self) -> None:
+        """Test that concurrent async reads share one request but not one result."""
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"items": [1]})
+
+        route = respx.get(SUBJECTS_URL).mock(side_effect=respond)
+
+        async with AsyncHTTPTransport(_config()) as transport:
+            results = await asyncio.gather(
+                *(transport.request("GET", "/api/v1/subjects") for _ in range(3))
+            )
+
+        assert route.call_count == 1
+        results[0]["items"].append(2)
+        assert [r["items"] for r in results[1:]] == [[1], [1]]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_waiters_raise_their_own_error(self) -> None:
+        """Test that each async waiter raises a separate chained exception."""
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(404, json={"detail": "Subject not found"})
+
+        respx.get(SUBJECTS_URL).mock(side_effect=respond)
+
+        async with AsyncHTTPTransport(_config()) as transport:
+            errors = await asyncio.gather(
+                *(transport.request("GET", "/api/v1/subjects") for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(e, ResourceNotFoundError) for e in errors)
+        assert len({id(e) for e in errors}) == 3
+        assert sum(e.__cause__ is None for e in errors) == 1
+
+    def test_request_key_is_cheap_and_type_aware(self) -> None:
+        """Test that keys are hashable tuples that keep differently sent values apart."""
+        key = HTTPTransport._request_key("GET", "/api/v1/subjects", None, {"limit": 1}, None)
+
+        assert key == HTTPTransport._request_key(
+            "GET", "/api/v1/subjects", None, {"limit": 1}, None
+        )
+        assert key != HTTPTransport._request_key(
+            "GET", "/api/v1/subjects", None, {"limit": True}, None
+        )
+        assert key != HTTPTransport._request_key(
+            "GET", "/api/v1/subjects", None, {"limit": "1"}, None
+        )
+        assert hash(key) is not None
+
+    def test_sync_waiters_retry_after_leader_interrupt(self) -> None:
+        """Test that an interrupt in the leader is not re-raised in waiting callers."""
+
+        class Interrupted(BaseException):
+            """Stand-in for KeyboardInterrupt in the leading thread."""
+
+        entered, release = threading.Event(), threading.Event()
+        outcomes: list[Any] = []
+
+        def interrupted_call() -> dict[str, Any]:
+            entered.set()
+            release.wait(5)
+            raise Interrupted
+
+        def lead() -> None:
+            try:
+                transport._single_flight("key", interrupted_call)
+            except Interrupted:
+                outcomes.append("interrupted")
+
+        def follow() -> None:
+            outcomes.append(transport._single_flight("key", lambda: {"items": [1]}))
+
+        with HTTPTransport(_config()) as transport:
+            leader = threading.Thread(target=lead)
+            follower = threading.Thread(target=follow)
+            leader.start()
+            assert entered.wait(5)
+            follower.start()
+            time.sleep(0.2)  # let the follower wait on the leader
+            release.set()
+            leader.join(5)
+            follower.join(5)
+
+        assert len(outcomes) == 2
+        assert "interrupted" in outcomes
+        assert {"items": [1]} in outcomes
+
+
+class TestStreamItems:
+    """Tests for iterating list responses item by item."""
+
+    PAGE = {"items": [{"id": 1, "score": 0.5}, {"id": 2, "score": 1.5}], "total": 2}
+
+    @respx.mock
+    def test_sync_streams_items_with_ijson(self) -> None:
+        """Test that items are parsed incrementally with floats kept as float."""
+        respx.get(SUBJECTS_URL).mock(return_value=httpx.Response(200, json=self.PAGE))
+
+        with HTTPTransport(_config()) as transport:
+            items = list(transport.stream_items("GET", "/api/v1/subjects"))
+
+        assert items == self.PAGE["items"]
+        assert all(type(item["score"]) is float for item in items)
+
+    @respx.mock
+    def test_sync_falls_back_without_ijson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that items are still yielded when ijson is not installed."""
+        monkeypatch.setattr("permission_sdk.transport.ijson", None)
+        respx.get(SUBJECTS_URL).mock(return_value=httpx.Response(200, json=self.PAGE))
+
+        with HTTPTransport(_config()) as transport:
+            items = list(transport.stream_items("GET", "/api/v1/subjects"))
+
+        assert items == self.PAGE["items"]
+
+    @respx.mock
+    def test_sync_maps_error_status(self) -> None:
+        """Test that error responses raise the mapped SDK exception."""
+        respx.get(SUBJECTS_URL).mock(
+            return_value=httpx.Response(404, json={"detail": "Subject not found"})
+        )
+
+        with HTTPTransport(_config()) as transport:
+            with pytest.raises(ResourceNotFoundError, match="Subject not found"):
+                list(transport.stream_items("GET", "/api/v1/subjects"))
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_streams_items_with_ijson(self) -> None:
+        """Test that the async transport parses items incrementally."""
+        respx.get(SUBJECTS_URL).mock(return_value=httpx.Response(200, json=self.PAGE))
+
+        async with AsyncHTTPTransport(_config()) as transport:
+            items = [item async for item in transport.stream_items("GET", "/api/v1/subjects")]
+
+        assert items == self.PAGE["items"]
+        assert all(type(item["score"]) is float for item in items)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_falls_back_without_ijson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the async transport yields items when ijson is not installed."""
+        monkeypatch.setattr("permission_sdk.async_transport.ijson", None)
+        respx.get(SUBJECTS_URL).mock(return_value=httpx.Response(200, json=self.PAGE))
+
+        async with AsyncHTTPTransport(_config()) as transport:
+            items = [item async for item in transport.stream_items("GET", "/api/v1/subjects")]
+
+        assert items == self.PAGE["items"]
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_maps_error_status(self) -> None:
+        """Test that the async transport raises the mapped SDK exception."""
+        respx.get(SUBJECTS_URL).mock(
+            return_value=httpx.Response(404, json={"detail": "Subject not found"})
+        )
+
+        async with AsyncHTTPTransport(_config()) as transport:
+            with pytest.raises(ResourceNotFoundError, match="Subject not found"):
+                async for _ in transport.stream_items("GET", "/api/v1/subjects"):
+                    pass
+
+
+class TestTotalDeadline:
+    """Tests for bounding a request and its retries by total_deadline."""
+
+    @respx.mock
+    def test_sync_deadline_during_backoff_raises_mapped_error(self) -> None:
+        """Test that running out of time before a retry surfaces the server's error."""
+        route = respx.get(SUBJECTS_URL).mock(
+            return_value=httpx.Response(503, headers={"Retry-After": "10"}, text="Overloaded")
+        )
+
+        with HTTPTransport(_config(total_deadline=1.0)) as transport:
+            with pytest.raises(ServerError, match="Overloaded") as exc_info:
+                transport.request("GET", "/api/v1/subjects")
+
+        assert route.call_count == 1
+        assert exc_info.value.status_code == 503
+        assert isinstance(exc_info.value.__context__, TimeoutError)
+
+    @respx.mock
+    def test_sync_timeout_reports_attempt_timeout(self) -> None:
+        """Test that the timeout error reports the deadline-bounded attempt timeout."""
+        respx.get(SUBJECTS_URL).mock(side_effect=httpx.ReadTimeout("timed out"))
+
+        with HTTPTransport(_config(timeout=30, total_deadline=0.5, max_retries=0)) as transport:
+            with pytest.raises(TimeoutError) as exc_info:
+                transport.request("GET", "/api/v1/subjects")
+
+        assert exc_info.value.timeout is not None
+        assert 0 < exc_info.value.timeout <= 0.5
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_deadline_during_backoff_raises_mapped_error(self) -> None:
+        """Test that the async transport surfaces the server's error at the deadline."""
+        route = respx.get(SUBJECTS_URL).mock(
+            return_value=httpx.Response(429, headers={"Retry-After": "10"}, text="Slow down")
+        )
+
+        async with AsyncHTTPTransport(_config(total_deadline=1.0)) as transport:
+            with pytest.raises(RateLimitError, match="Slow down") as exc_info:
+                await transport.request("GET", "/api/v1/subjects")
+
+        assert route.call_count == 1
+        assert exc_info.value.retry_after == 10
+        assert isinstance(exc_info.value.__context__, TimeoutError)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_timeout_reports_attempt_timeout(self) -> None:
+        """Test that the async timeout error reports the attempt timeout used."""
+        respx.get(SUBJECTS_URL).mock(side_effect=httpx.ReadTimeout("timed out"))
+
+        config = _config(timeout=30, total_deadline=0.5, max_retries=0)
+        async with AsyncHTTPTransport(config) as transport:
+            with pytest.raises(TimeoutError) as exc_info:
+                await transport.request("GET", "/api/v1/subjects")
+
+        assert exc_info.value.timeout is not None
+        assert 0 < exc_info.value.timeout <= 0.5
+
+
+class TestStatusRetries:
+    """Tests for retrying 429 and 5xx responses."""
+
+    @respx.mock
+    def test_sync_retries_server_error_then_succeeds(self) -> None:
+        """Test that a transient 503 on a read is retried."""
+        route = respx.get(SUBJECTS_URL).mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={"items": []})]
+        )
+
+        with HTTPTransport(_config(retry_backoff=0)) as transport:
+            result = transport.request("GET", "/api/v1/subjects")
+
+        assert result == {"items": []}
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_sync_gives_up_after_max_retries(self) -> None:
+        """Test that the last 5xx is raised once retries are exhausted."""
+        route = respx.get(SUBJECTS_URL).mock(return_value=httpx.Response(500, text="Boom"))
+
+        with HTTPTransport(_config(retry_backoff=0, max_retries=2)) as transport:
+            with pytest.raises(ServerError, match="Boom"):
+                transport.request("GET", "/api/v1/subjects")
+
+        assert route.call_count == 3
+
+    @respx.mock
+    def test_sync_retries_put_by_default(self) -> None:
+        """Test that an idempotent PUT is retried after a 503 without a key."""
+        url = f"{BASE_URL}/api/v1/subjects/user:alice"
+        route = respx.put(url).mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={"id": "user:alice"})]
+        )
+
+        with HTTPTransport(_config(retry_backoff=0)) as transport:
+            transport.request("PUT", "/api/v1/subjects/user:alice", json={})
+
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_sync_retries_rate_limited_write(self) -> None:
+        """Test that a 429 is retried even for a non-idempotent write."""
+        url = f"{BASE_URL}/api/v1/permissions/revoke"
+        route = respx.post(url).mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json={"revoked": True}),
+            ]
+        )
+
+        with HTTPTransport(_config()) as transport:
+            result = transport.request("POST", "/api/v1/permissions/revoke", json={})
+
+        assert result == {"revoked": True}
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_sync_invalid_retry_after_falls_back_to_backoff(self) -> None:
+        """Test that an invalid Retry-After is ignored rather than trusted."""
+        route = respx.get(SUBJECTS_URL).mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "nan"}),
+                httpx.Response(200, json={"items": []}),
+            ]
+        )
+
+        with HTTPTransport(_config(retry_backoff=0)) as transport:
+            transport.request("GET", "/api/v1/subjects")
+
+        assert route.call_count == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_retries_server_error_then_succeeds(self) -> None:
+        """Test that the async transport retries a transient 502."""
+        route = respx.get(SUBJECTS_URL).mock(
+            side_effect=[httpx.Response(502), httpx.Response(200, json={"items": []})]
+        )
+
+        async with AsyncHTTPTransport(_config(retry_backoff=0)) as transport:
+            result = await transport.request("GET", "/api/v1/subjects")
+
+        assert result == {"items": []}
+        assert route.call_count == 2
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_gives_up_after_max_retries(self) -> None:
+        """Test that the async transport raises the last 429 once retries run out."""
+        route = respx.get(SUBJECTS_URL).mock(
+            return_value=httpx.Response(429, headers={"Retry-After": "0"})
+        )
+
+        async with AsyncHTTPTransport(_config(max_retries=1)) as transport:
+            with pytest.raises(RateLimitError):
+                await transport.request("GET", "/api/v1/subjects")
+
+        assert route.call_count == 2
+
+
+class TestHTTPResponseCaching:
+    """Tests for serving and revalidating GETs from the HTTP response cache."""
+
+    @respx.mock
+    def test_sync_revalidates_stale_entry_with_etag(self) -> None:
+        """Test that a stale entry is revalidated and served on 304."""
+        route = respx.get(SUBJECTS_URL).mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    json={"items": [1]},
+                    headers={"ETag": '"v1"', "Cache-Control": "no-cache"},
+                ),
+                httpx.Response(304, headers={"ETag": '"v1"'}),
+            ]
+        )
+
+        with HTTPTransport(_config(http_cache_enabled=True)) as transport:
+            first = transport.request("GET", "/api/v1/subjects")
+            second = transport.request("GET", "/api/v1/subjects")
+
+        assert first == second == {"items": [1]}
+        assert route.call_count == 2
+        assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+
+    @respx.mock
+    def test_sync_cached_body_is_not_shared(self) -> None:
+        """Test that mutating a returned body does not change the cached one."""
+        route = respx.get(SUBJECTS_URL).mock(
+            return_value=httpx.Response(
+                200, json={"items": [1]}, headers={"Cache-Control": "max-age=60"}
+            )
+        )
+
+        with HTTPTransport(_config(http_cache_enabled=True)) as transport:
+            transport.request("GET", "/api/v1/subjects")["items"].append(2)
+            transport.request("GET", "/api/v1/subjects")["items"].append(3)
+            result = transport.request("GET", "/api/v1/subjects")
+
+        assert result == {"items": [1]}
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_sync_no_store_is_not_cached(self) -> None:
+        """Test that no-store responses are fetched again without validators."""
+        route = respx.get(SUBJECTS_URL).mock(
+            return_value=httpx.Response(
+                200, json={"items": []}, headers={"ETag": '"v1"', "Cache-Control": "no-store"}
+            )
+        )
+
+        with HTTPTransport(_config(http_cache_enabled=True)) as transport:
+            transport.request("GET", "/api/v1/subjects")
+            transport.request("GET", "/api/v1/subjects")
+
+        assert route.call_count == 2
+        assert "If-None-Match" not in route.calls.last.request.headers
+
+    @respx.mock
+    def test_sync_unsolicited_304_is_an_error(self) -> None:
+        """Test that a 304 answering an unconditional request is not treated as success."""
+        respx.get(SUBJECTS_URL).mock(return_value=httpx.Response(304))
+
+        with HTTPTransport(_config(http_cache_enabled=True)) as transport:
+            with pytest.raises(ServerError):
+                transport.request("GET", "/api/v1/subjects")
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_revalidates_stale_entry_with_etag(self) -> None:
+        """Test that the async transport revalidates and returns a copy on 304."""
+        route = respx.get(SUBJECTS_URL).mock(
+            side_effect=[
+                httpx.Response(
+                    200,
+                    json={"items": [1]},
+                    headers={"ETag": '"v1"', "Cache-Control": "no-cache"},
+                ),
+                httpx.Response(304, headers={"ETag": '"v1"'}),
+            ]
+        )
+
+        async with AsyncHTTPTransport(_config(http_cache_enabled=True)) as transport:
+            (await transport.request("GET", "/api/v1/subjects"))["items"].append(2)
+            second = await transport.request("GET", "/api/v1/subjects")
+
+        assert second == {"items": [1]}
+        assert route.call_count == 2
+        assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_no_store_is_not_cached(self) -> None:
+        """Test that the async transport does not cache no-store responses."""
+        route = respx.get(SUBJECTS_URL).mock(
+            return_value=httpx.Response(
+                200, json={"items": []}, headers={"Cache-Control": "no-store, max-age=60"}
+            )
+        )
+
+        async with AsyncHTTPTransport(_config(http_cache_enabled=True)) as transport:
+            await transport.request("GET", "/api/v1/subjects")
+            await transport.request("GET", "/api/v1/subjects")
+
+        assert route.call_count == 2
+
+
+class TestEnvironmentProxies:
+    """Tests for honoring HTTP(S)_PROXY alongside the tuned socket options."""
+
+    PROXY_URL = "http://proxy.example.com:3128"
+
+    def test_sync_routes_through_env_proxy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that HTTPS_PROXY still applies with the custom transport."""
+        monkeypatch.setenv("HTTPS_PROXY", self.PROXY_URL)
+
+        with HTTPTransport(_config(base_url="https://api.example.com")) as transport:
+            routed = transport.client._transport_for_url(httpx.URL("https://api.example.com"))
+
+            assert routed is not transport.client._transport
+            assert isinstance(routed._pool, httpcore.HTTPProxy)
+
+    def test_sync_no_proxy_bypasses_env_proxy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that hosts listed in NO_PROXY use the direct transport."""
+        monkeypatch.setenv("HTTPS_PROXY", self.PROXY_URL)
+        monkeypatch.setenv("NO_PROXY", "api.example.com")
+
+        with HTTPTransport(_config(base_url="https://api.example.com")) as transport:
+            routed = transport.client._transport_for_url(httpx.URL("https://api.example.com"))
+
+            assert routed is transport.client._transport
+
+    @pytest.mark.asyncio
+    async def test_async_routes_through_env_proxy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the async transport also honors HTTPS_PROXY."""
+        monkeypatch.setenv("HTTPS_PROXY", self.PROXY_URL)
+
+        async with AsyncHTTPTransport(_config(base_url="https://api.example.com")) as transport:
+            routed = transport.client._transport_for_url(httpx.URL("https://api.example.com"))
+
+            assert routed is not transport.client._transport
+            assert isinstance(routed._pool, httpcore.AsyncHTTPProxy)
@@ -0,0 +1,117 @@
+"""Unit tests for SDK utility functions.
+
+This module tests the helpers in permission_sdk.utils.
+"""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+
+from permission_sdk import ValidationError
+from permission_sdk.utils import (
+    chunk_list,
+    iter_chunks,
+    json_dumps,
+    json_loads,
+    parse_retry_after,
+    parse_subject_identifier,
+    validate_action,
+    validate_scope_identifier,
+    validate_subject_identifier,
+)
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+
+    def test_missing_header(self) -> None:
+        """Test that a missing header yields None."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+
+    def test_delay_seconds(self) -> None:
+        """Test parsing a delay expressed in seconds."""
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("1.5") == 1.5
+
+    @pytest.mark.parametrize("value", ["-5", "nan", "inf", "-inf"])
+    def test_invalid_seconds_rejected(self, value: str) -> None:
+        """Test that negative and non-finite delays yield None."""
+        assert parse_retry_after(value) is None
+
+    def test_http_date_in_future(self) -> None:
+        """Test parsing an HTTP-date in the future."""
+        retry_at = datetime.now(UTC) + timedelta(seconds=60)
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert delay is not None
+        assert 55 <= delay <= 60
+
+    def test_http_date_in_past(self) -> None:
+        """Test that an HTTP-date in the past yields zero."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_invalid_value(self) -> None:
+        """Test that an unparseable value yields None."""
+        assert parse_retry_after("soon") is None
+
+
+class TestJSONHelpers:
+    """Tests for json_dumps and json_loads."""
+
+    def test_round_trip(self) -> None:
+        """Test that data survives a dump/load round trip."""
+        data = {"subjects": ["user:123"], "scope": "docs", "allowed": True}
+        assert json_loads(json_dumps(data)) == data
+
+    def test_dumps_is_compact_bytes(self) -> None:
+        """Test that output is compact UTF-8 bytes."""
+        assert json_dumps({"a": 1, "b": "é"}) == '{"a":1,"b":"é"}'.encode()
+
+
+class TestValidators:
+    """Tests for identifier validators."""
+
+    def test_valid_identifiers(self) -> None:
+        """Test that well-formed identifiers pass."""
+        validate_subject_identifier("user:john.doe")
+        validate_scope_identifier("api:v1.users")
+        validate_action("read")
+
+    def test_trailing_newline_rejected(self) -> None:
+        """Test that a trailing newline does not slip past the pattern."""
+        with pytest.raises(ValidationError):
+            validate_subject_identifier("user:123\n")
+        with pytest.raises(ValidationError):
+            validate_action("read\n")
+
+    def test_parse_subject_identifier(self) -> None:
+        """Test splitting subjects into type and ID."""
+        assert parse_subject_identifier("user:john.doe") == ("user", "john.doe")
+        assert parse_subject_identifier("system") == ("system", "system")
+
+    def test_overlong_identifier_rejected(self) -> None:
+        """Test that identifiers over the length limit are rejected."""
+        with pytest.raises(ValidationError, match="at most"):
+            validate_scope_identifier("a" * 256)
+
+
+class TestChunking:
+    """Tests for chunk_list and iter_chunks."""
+
+    def test_iter_chunks_matches_chunk_list(self) -> None:
+        """Test that lazy chunking yields the same chunks as chunk_list."""
+        items = list(range(7))
+        assert list(iter_chunks(items, 3)) == chunk_list(items, 3) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_iter_chunks_accepts_generators(self) -> None:
+        """Test that any iterable can be chunked."""
+        assert list(iter_chunks((i for i in range(4)), 2)) == [[0, 1], [2, 3]]
+        assert list(iter_chunks([], 2)) == []
+
+    @pytest.mark.parametrize("chunk_size", [0, -1])
+    def test_iter_chunks_rejects_non_positive_size(self, chunk_size: int) -> None:
+        """Test that a non-positive chunk size is rejected rather than yielding nothing."""
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            list(iter_chunks([1, 2, 3], chunk_size))